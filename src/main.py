@@ -4,36 +4,7 @@ Automatically captures screenshots of Adobe Acrobat pages during navigation.
 """
 
 import sys
-import os
-import threading
-import time
 import ctypes
-import logging
-import shutil
-import zipfile
-import winsound
-import subprocess
-import tempfile
-import urllib.request
-import urllib.error
-from datetime import datetime, timedelta
-from pathlib import Path
-import hashlib
-
-import pystray
-from PIL import Image, ImageDraw
-from pynput import keyboard, mouse
-import pygetwindow as gw
-import mss
-import mss.tools
-import json
-import imagehash
-
-# Application version - Update this, version_info.txt, and installer.iss together
-APP_VERSION = "2.2.0"
-GITHUB_REPO = "draphael123/adobe-reader"
-UPDATE_CHECK_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-DOWNLOAD_PAGE_URL = f"https://github.com/{GITHUB_REPO}/releases/latest"
 
 # Single instance check using Windows mutex
 SINGLE_INSTANCE_MUTEX = None
@@ -92,9 +63,64 @@ def show_already_running_message():
         )
 
 
-# Check for single instance before anything else
+# Check for single instance before the heavy GUI/capture imports below,
+# so a second launch exits without loading them
 check_single_instance()
 
+import os
+import atexit
+import threading
+import time
+import queue
+import io
+import re
+from ctypes import wintypes
+import logging
+import shutil
+import zipfile
+import subprocess
+import tempfile
+import urllib.request
+import urllib.error
+import ssl
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox, scrolledtext
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pystray
+from PIL import Image, ImageDraw, PdfParser, __version__ as PIL_VERSION
+from pynput import keyboard, mouse
+import pygetwindow as gw
+import mss
+import mss.tools
+import mss.windows
+import json
+import numpy as np
+
+try:
+    import dxcam  # Desktop Duplication capture, optional
+except ImportError:
+    dxcam = None
+
+try:
+    import img2pdf  # Lossless PDF export that embeds JPEGs as-is, optional
+except ImportError:
+    img2pdf = None
+
+# Skip compositing layered windows (tooltips, overlays) into mss grabs
+mss.windows.CAPTUREBLT = 0
+
+# Application version - Update this, version_info.txt, and installer.iss together
+APP_VERSION = "2.2.0"
+GITHUB_REPO = "draphael123/adobe-reader"
+UPDATE_CHECK_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+DOWNLOAD_PAGE_URL = f"https://github.com/{GITHUB_REPO}/releases/latest"
+
 # Enable DPI awareness for correct screenshots on high-DPI displays
 try:
     ctypes.windll.shcore.SetProcessDpiAwareness(2)  # Per-monitor DPI aware
@@ -109,6 +135,7 @@ CONFIG_DIR = Path(os.environ.get('APPDATA', Path.home())) / 'PDFScreenshotTool'
 CONFIG_FILE = CONFIG_DIR / 'config.json'
 LOG_FILE = CONFIG_DIR / 'app.log'
 STATS_FILE = CONFIG_DIR / 'stats.json'
+UPDATE_CACHE_FILE = CONFIG_DIR / 'update_cache.json'
 PORTABLE_FLAG = Path(__file__).parent.parent / '.portable'
 
 # Check for portable mode
@@ -117,29 +144,51 @@ if PORTABLE_FLAG.exists():
     CONFIG_FILE = CONFIG_DIR / 'config.json'
     LOG_FILE = CONFIG_DIR / 'app.log'
     STATS_FILE = CONFIG_DIR / 'stats.json'
+    UPDATE_CACHE_FILE = CONFIG_DIR / 'update_cache.json'
 
 # Setup logging with rotation
 CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 # Rotate old log files (keep last 5, max 10MB each)
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 log_handler = RotatingFileHandler(
     LOG_FILE, 
     maxBytes=10*1024*1024,  # 10MB
     backupCount=5,
     encoding='utf-8'
 )
+console_handler = logging.StreamHandler()
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+log_handler.setFormatter(log_formatter)
+console_handler.setFormatter(log_formatter)
+
+# Callers only enqueue records; a listener thread does the formatting and
+# file/console writes so logging never blocks the input hooks or captures
+log_queue = queue.Queue()
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+log_listener = QueueListener(log_queue, log_handler, console_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
 
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        log_handler,
-        logging.StreamHandler()
-    ]
+    handlers=[queue_handler]
 )
 logger = logging.getLogger(__name__)
 
+
+def write_json_atomic(path, data, indent=None):
+    """Write JSON to path via a temp file so a crash never leaves it half-written."""
+    payload = json.dumps(data, indent=indent).encode('utf-8')
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
 # Default configuration
 DEFAULT_CONFIG = {
     # Basic settings
@@ -167,8 +216,11 @@ DEFAULT_CONFIG = {
     'duplicate_similarity_threshold': 5,  # max hash difference to consider duplicate (0-64, 0=exact match)
     
     # Image settings
-    'image_format': 'png',  # 'png', 'jpeg', or 'webp'
+    'image_format': 'webp',  # 'png', 'jpeg', or 'webp'
     'jpeg_quality': 90,
+    'png_compression_level': 1,  # zlib level 0-9 (higher = smaller but slower)
+    'webp_lossless': True,  # lossless WebP: about half the size of PNG for screenshots
+    'resample_filter': 'box',  # downscaling filter: 'box', 'bilinear', 'bicubic' or 'lanczos'
     'max_image_width': 0,  # 0 = no limit
     'max_image_height': 0,  # 0 = no limit
     'grayscale_mode': False,  # convert to grayscale
@@ -289,9 +341,14 @@ DEFAULT_STATS = {
 class Statistics:
     """Manages application statistics."""
     
+    SAVE_DELAY = 2.0  # Seconds to coalesce capture bursts into one write
+    
     def __init__(self):
         self.stats = DEFAULT_STATS.copy()
         self.session_start = datetime.now()
+        self._lock = threading.RLock()
+        self._save_timer = None
+        self._dirty = False
         self.load()
         
         # Initialize first run date
@@ -312,23 +369,50 @@ class Statistics:
     def save(self):
         """Save statistics to file."""
         try:
-            with open(STATS_FILE, 'w') as f:
-                json.dump(self.stats, f, indent=2)
+            with self._lock:
+                self._dirty = False
+                write_json_atomic(STATS_FILE, self.stats)
         except Exception as e:
             logger.error(f"Error saving stats: {e}")
     
+    def _schedule_save(self):
+        """Mark stats dirty and save once captures settle."""
+        with self._lock:
+            self._dirty = True
+            if self._save_timer:
+                return
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self):
+        """Write pending changes now."""
+        with self._lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty:
+                self.save()
+    
     def record_capture(self, filepath, doc_name):
         """Record a capture event."""
+        # Stat the file before taking the lock
+        try:
+            size = Path(filepath).stat().st_size
+        except Exception:
+            size = 0
+        
+        with self._lock:
+            self._record_capture(size, doc_name)
+        self._schedule_save()
+    
+    def _record_capture(self, size, doc_name):
         self.stats['total_captures'] += 1
         self.stats['session_captures'] += 1
         self.stats['last_capture_time'] = datetime.now().isoformat()
         
         # Track file size
-        try:
-            size = Path(filepath).stat().st_size
-            self.stats['total_size_bytes'] += size
-        except Exception:
-            pass
+        self.stats['total_size_bytes'] += size
         
         # Track by date
         today = datetime.now().strftime('%Y-%m-%d')
@@ -341,8 +425,6 @@ class Statistics:
             self.stats['documents_captured'].append(doc_name)
             if len(self.stats['documents_captured']) > 50:
                 self.stats['documents_captured'] = self.stats['documents_captured'][-50:]
-        
-        self.save()
     
     def get_summary(self):
         """Get a summary of statistics."""
@@ -370,9 +452,19 @@ class Statistics:
 class Config:
     """Manages application configuration."""
     
+    SAVE_DELAY = 1.0  # Seconds to coalesce UI changes into one write
+    
     def __init__(self):
         self.config = DEFAULT_CONFIG.copy()
         self.is_first_run = not CONFIG_FILE.exists()
+        self._cache = {}  # Resolved values, invalidated per key by set()
+        self._version = 0  # Bumped on every change
+        self._bulk_depth = 0
+        self._changed_keys = set()
+        self._listeners = []
+        self._save_lock = threading.Lock()
+        self._save_timer = None
+        self._dirty = False
         self.load()
     
     def load(self):
@@ -439,6 +531,9 @@ class Config:
                 elif key == 'jpeg_quality' and (value < 1 or value > 100):
                     logger.warning(f"jpeg_quality out of range, clamping to 1-100")
                     validated[key] = max(1, min(100, value))
+                elif key == 'png_compression_level' and (value < 0 or value > 9):
+                    logger.warning("png_compression_level out of range, clamping to 0-9")
+                    validated[key] = max(0, min(9, value))
                 elif key == 'duplicate_similarity_threshold' and (value < 0 or value > 64):
                     logger.warning(f"duplicate_similarity_threshold out of range, clamping to 0-64")
                     validated[key] = max(0, min(64, value))
@@ -452,30 +547,159 @@ class Config:
     def save(self):
         """Save configuration to file."""
         try:
-            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            with self._save_lock:
+                self._dirty = False
+                CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+                write_json_atomic(CONFIG_FILE, dict(self.config), indent=2)
             logger.info("Configuration saved")
         except Exception as e:
             logger.error(f"Error saving config: {e}")
     
-    def get(self, key):
-        return self.config.get(key, DEFAULT_CONFIG.get(key))
+    def _schedule_save(self):
+        """Mark config dirty and save after SAVE_DELAY, restarting the wait."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self):
+        """Write pending changes now."""
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            dirty = self._dirty
+        if dirty:
+            self.save()
+    
+    @property
+    def version(self):
+        """Counter that changes whenever a setting is changed."""
+        return self._version
+    
+    def get(self, key, default=None):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        if key in self.config:
+            value = self.config[key]
+        elif key in DEFAULT_CONFIG:
+            value = DEFAULT_CONFIG[key]
+        else:
+            return default
+        self._cache[key] = value
+        return value
     
     def set(self, key, value):
         self.config[key] = value
-        self.save()
+        self._cache.pop(key, None)
+        self._version += 1
+        self._changed_keys.add(key)
+        if not self._bulk_depth:
+            self._commit()
+    
+    def add_listener(self, callback):
+        """Register callback(changed_keys) to run after settings change."""
+        self._listeners.append(callback)
+    
+    def _commit(self):
+        """Schedule a save and tell listeners which keys changed."""
+        self._schedule_save()
+        changed, self._changed_keys = frozenset(self._changed_keys), set()
+        for callback in self._listeners:
+            try:
+                callback(changed)
+            except Exception as e:
+                logger.error(f"Error in config listener: {e}")
+    
+    def update(self, mapping):
+        """Apply several settings at once with a single save."""
+        with self.bulk_update():
+            for key, value in mapping.items():
+                self.set(key, value)
+    
+    @contextmanager
+    def bulk_update(self):
+        """Group several set() calls so the file is only written once."""
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth:
+                self._commit()
 
 
 class UpdateChecker:
     """Handles checking for and downloading updates."""
     
+    DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB reads/writes
+    PROGRESS_INTERVAL = 0.1  # Max 10 progress callbacks per second
+    
     def __init__(self, config):
         self.config = config
         self.latest_version = None
         self.download_url = None
         self.release_notes = None
         self.checking = False
+        
+        # One opener (and SSL context) shared by the check and the download,
+        # so the CA store is loaded once rather than per request
+        self._opener = urllib.request.build_opener(
+            urllib.request.HTTPSHandler(context=ssl.create_default_context())
+        )
+        self._opener.addheaders = [('User-Agent', f'PDFScreenshotTool/{APP_VERSION}')]
+        
+        # Last known release, served from disk until the next check
+        self._etag = None
+        self.load_cache()
+    
+    def load_cache(self):
+        """Load the last fetched release info from disk."""
+        try:
+            if UPDATE_CACHE_FILE.exists():
+                with open(UPDATE_CACHE_FILE, 'r') as f:
+                    cache = json.load(f)
+                self._etag = cache.get('etag')
+                self.latest_version = cache.get('latest_version')
+                self.release_notes = cache.get('release_notes')
+                self.download_url = cache.get('download_url')
+        except Exception as e:
+            logger.debug(f"Error loading update cache: {e}")
+    
+    def save_cache(self):
+        """Persist the last fetched release info."""
+        try:
+            write_json_atomic(UPDATE_CACHE_FILE, {
+                'fetched_at': datetime.now().isoformat(),
+                'etag': self._etag,
+                'latest_version': self.latest_version,
+                'release_notes': self.release_notes,
+                'download_url': self.download_url,
+            })
+        except Exception as e:
+            logger.debug(f"Error saving update cache: {e}")
+    
+    def _apply_release(self, data):
+        """Take version, notes and installer URL from a release payload."""
+        self.latest_version = data.get('tag_name', '').lstrip('v')
+        self.release_notes = data.get('body', '')
+        
+        # Find the installer asset
+        self.download_url = None
+        assets = data.get('assets', [])
+        for asset in assets:
+            if 'Setup' in asset.get('name', '') and asset.get('name', '').endswith('.exe'):
+                self.download_url = asset.get('browser_download_url')
+                break
+        
+        # Fallback to release page if no direct download found
+        if not self.download_url:
+            self.download_url = data.get('html_url', DOWNLOAD_PAGE_URL)
     
     def parse_version(self, version_str):
         """Parse version string into tuple for comparison."""
@@ -523,31 +747,24 @@ class UpdateChecker:
             try:
                 logger.info("Checking for updates...")
                 
-                # Create request with headers
-                req = urllib.request.Request(
-                    UPDATE_CHECK_URL,
-                    headers={
-                        'User-Agent': f'PDFScreenshotTool/{APP_VERSION}',
-                        'Accept': 'application/vnd.github.v3+json'
-                    }
-                )
-                
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    data = json.loads(response.read().decode('utf-8'))
+                # Create request with headers; a matching ETag gets a cheap 304
+                headers = {'Accept': 'application/vnd.github.v3+json'}
+                if self._etag and self.latest_version:
+                    headers['If-None-Match'] = self._etag
+                req = urllib.request.Request(UPDATE_CHECK_URL, headers=headers)
                 
-                self.latest_version = data.get('tag_name', '').lstrip('v')
-                self.release_notes = data.get('body', '')
-                
-                # Find the installer asset
-                assets = data.get('assets', [])
-                for asset in assets:
-                    if 'Setup' in asset.get('name', '') and asset.get('name', '').endswith('.exe'):
-                        self.download_url = asset.get('browser_download_url')
-                        break
-                
-                # Fallback to release page if no direct download found
-                if not self.download_url:
-                    self.download_url = data.get('html_url', DOWNLOAD_PAGE_URL)
+                try:
+                    with self._opener.open(req, timeout=10) as response:
+                        data = json.loads(response.read().decode('utf-8'))
+                        etag = response.headers.get('ETag')
+                except urllib.error.HTTPError as e:
+                    if e.code != 304:
+                        raise
+                    logger.info("Release info unchanged since last check")
+                else:
+                    self._apply_release(data)
+                    self._etag = etag
+                    self.save_cache()
                 
                 # Update last check time
                 self.config.set('last_update_check', datetime.now().isoformat())
@@ -598,17 +815,18 @@ class UpdateChecker:
                 temp_dir = Path(tempfile.gettempdir())
                 installer_path = temp_dir / f"PDFScreenshotTool_Setup_{self.latest_version}.exe"
                 
-                req = urllib.request.Request(
-                    self.download_url,
-                    headers={'User-Agent': f'PDFScreenshotTool/{APP_VERSION}'}
-                )
-                
-                with urllib.request.urlopen(req, timeout=60) as response:
+                with self._opener.open(self.download_url, timeout=60) as response:
                     total_size = int(response.headers.get('content-length', 0))
                     downloaded = 0
-                    chunk_size = 8192
+                    chunk_size = self.DOWNLOAD_CHUNK_SIZE
+                    last_progress_time = 0.0
                     
-                    with open(installer_path, 'wb') as f:
+                    with open(installer_path, 'wb', buffering=chunk_size) as f:
+                        # Reserve the full size up front so the file grows once
+                        if total_size > 0:
+                            f.truncate(total_size)
+                            f.seek(0)
+                        
                         while True:
                             chunk = response.read(chunk_size)
                             if not chunk:
@@ -616,9 +834,16 @@ class UpdateChecker:
                             f.write(chunk)
                             downloaded += len(chunk)
                             
+                            # Throttle progress updates; always report completion
                             if callback and total_size > 0:
-                                progress = int((downloaded / total_size) * 100)
-                                callback('downloading', progress)
+                                now = time.monotonic()
+                                if downloaded >= total_size or now - last_progress_time >= self.PROGRESS_INTERVAL:
+                                    last_progress_time = now
+                                    progress = int((downloaded / total_size) * 100)
+                                    callback('downloading', progress)
+                        
+                        # Drop any unused preallocation if the server sent less
+                        f.truncate(downloaded)
                 
                 logger.info(f"Download complete: {installer_path}")
                 
@@ -654,6 +879,32 @@ class UpdateChecker:
         logger.info(f"Opened download page: {url}")
 
 
+def launch_detached(args):
+    """Start a helper program such as Explorer without a shell or console."""
+    subprocess.Popen(
+        [str(arg) for arg in args],
+        creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NO_WINDOW,
+        close_fds=True
+    )
+
+
+_ensured_folders = set()
+
+
+def ensure_folder(folder):
+    """Create a folder if needed, skipping folders already created this session."""
+    folder = str(folder)
+    if folder not in _ensured_folders:
+        Path(folder).mkdir(parents=True, exist_ok=True)
+        _ensured_folders.add(folder)
+    return folder
+
+
+def forget_ensured_folders():
+    """Make ensure_folder() check the disk again, e.g. after the save folder changes."""
+    _ensured_folders.clear()
+
+
 def get_executable_path():
     """Get the path to the current executable."""
     if getattr(sys, 'frozen', False):
@@ -713,6 +964,8 @@ def is_startup_enabled():
 def play_capture_sound(config=None):
     """Play a camera shutter sound."""
     try:
+        import winsound
+        
         custom_sound = config.get('custom_sound_file') if config else ''
         
         if custom_sound and Path(custom_sound).exists():
@@ -725,6 +978,22 @@ def play_capture_sound(config=None):
         pass
 
 
+@lru_cache(maxsize=4)
+def load_watermark_image(path, mtime, max_size, opacity):
+    """Load a watermark image scaled to fit max_size with its alpha faded to opacity percent.
+    
+    Cached per file version and capture size; callers must not modify the result.
+    """
+    watermark = Image.open(path).convert('RGBA')
+    if watermark.width > max_size[0] or watermark.height > max_size[1]:
+        watermark.thumbnail(max_size, Image.LANCZOS)
+    
+    # Pillow builds a 256-entry lookup table from the function, not a per-pixel call
+    alpha = watermark.getchannel('A').point(lambda p: int(p * (opacity / 100)))
+    watermark.putalpha(alpha)
+    return watermark
+
+
 def apply_watermark(img, config):
     """Apply watermark to image based on config settings."""
     if not config.get('watermark_enabled'):
@@ -803,28 +1072,20 @@ def apply_watermark(img, config):
         )
         draw.text((x, y), text, font=font, fill=color)
         
-        # Composite
-        img = img.convert('RGBA')
-        img = Image.alpha_composite(img, overlay)
-        img = img.convert('RGB')
+        # Composite through the overlay's alpha; paste converts the overlay to the
+        # capture's mode, so grayscale captures stay 'L'
+        img.paste(overlay, (0, 0), overlay)
     
     elif watermark_type == 'image':
         # Image watermark
         watermark_path = config.get('watermark_image_path', '')
         if watermark_path and Path(watermark_path).exists():
             try:
-                watermark = Image.open(watermark_path).convert('RGBA')
-                
-                # Scale watermark if needed (max 1/4 of image size)
-                max_wm_width = img.width // 4
-                max_wm_height = img.height // 4
-                if watermark.width > max_wm_width or watermark.height > max_wm_height:
-                    watermark.thumbnail((max_wm_width, max_wm_height), Image.LANCZOS)
-                
-                # Apply opacity
-                alpha = watermark.split()[3]
-                alpha = alpha.point(lambda p: int(p * (opacity / 100)))
-                watermark.putalpha(alpha)
+                # Scaled to at most 1/4 of the image, reloaded only if the file changes
+                watermark = load_watermark_image(
+                    watermark_path, os.path.getmtime(watermark_path),
+                    (img.width // 4, img.height // 4), opacity
+                )
                 
                 # Calculate position
                 img_width, img_height = img.size
@@ -842,10 +1103,8 @@ def apply_watermark(img, config):
                 else:  # bottom-right
                     x, y = img_width - wm_width - padding, img_height - wm_height - padding
                 
-                # Paste watermark
-                img = img.convert('RGBA')
+                # Paste watermark, using its alpha as the mask (works on RGB and L captures)
                 img.paste(watermark, (x, y), watermark)
-                img = img.convert('RGB')
             except Exception as e:
                 logger.error(f"Error applying image watermark: {e}")
     
@@ -881,6 +1140,48 @@ def apply_crop_margins(img, config):
     return img.crop((left, top, right, bottom))
 
 
+RESAMPLE_FILTERS = {
+    'box': Image.BOX,
+    'bilinear': Image.BILINEAR,
+    'bicubic': Image.BICUBIC,
+    'lanczos': Image.LANCZOS,
+}
+
+
+def get_resample_filter(config):
+    """Resampling filter to use when downscaling captures."""
+    return RESAMPLE_FILTERS.get(config.get('resample_filter'), Image.BOX)
+
+
+# File types whose contents are already entropy-coded
+PRECOMPRESSED_SUFFIXES = frozenset(['.png', '.jpg', '.jpeg', '.webp'])
+
+ZIP_COPY_CHUNK_SIZE = 1 << 20
+
+
+def zip_add_file(zf, path, arcname, compress_type=None):
+    """Add a file to an open ZipFile, copying in 1 MiB chunks instead of ZipFile.write's 8 KiB."""
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zf.compression if compress_type is None else compress_type
+    with open(path, 'rb') as src, zf.open(zinfo, 'w') as dest:
+        shutil.copyfileobj(src, dest, ZIP_COPY_CHUNK_SIZE)
+
+
+@lru_cache(maxsize=16)
+def border_fill(border_color, mode):
+    """Fill value for a '#rrggbb' border colour in the given image mode (white if invalid)."""
+    try:
+        value = border_color[1:] if border_color.startswith('#') else border_color
+        color = (int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16))
+    except (AttributeError, ValueError):
+        color = (255, 255, 255)
+    
+    if mode == 'L':
+        # Same luma weights Pillow uses for RGB -> L
+        return (color[0] * 299 + color[1] * 587 + color[2] * 114) // 1000
+    return color
+
+
 def apply_resolution_scale(img, config):
     """Scale image resolution based on config."""
     scale = config.get('resolution_scale', 100)
@@ -894,7 +1195,138 @@ def apply_resolution_scale(img, config):
     if new_width < 10 or new_height < 10:
         return img
     
-    return img.resize((new_width, new_height), Image.LANCZOS)
+    return img.resize((new_width, new_height), get_resample_filter(config))
+
+
+@lru_cache(maxsize=4)
+def _dct_matrix(size, rows):
+    """First `rows` rows of the (unnormalised) DCT-II basis for `size` samples."""
+    k = np.arange(rows, dtype=np.float64)[:, None]
+    n = np.arange(size, dtype=np.float64)[None, :]
+    return np.cos(np.pi * (2 * n + 1) * k / (2 * size))
+
+
+def perceptual_hash(img, hash_size=16):
+    """Compute a DCT perceptual hash (pHash) of an image as a hash_size**2-bit int."""
+    sample_size = hash_size * 4
+    if img.size != (sample_size, sample_size):
+        img = img.resize((sample_size, sample_size), Image.BOX)
+    pixels = np.asarray(img.convert('L'), dtype=np.float64)
+    
+    # Only the low-frequency hash_size x hash_size corner of the 2-D DCT is needed
+    basis = _dct_matrix(sample_size, hash_size)
+    low_freq = basis @ pixels @ basis.T
+    bits = low_freq > np.median(low_freq)
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+
+if hasattr(int, 'bit_count'):  # Python 3.10+
+    def hash_distance(a, b):
+        """Hamming distance between two perceptual hashes."""
+        return (a ^ b).bit_count()
+else:
+    def hash_distance(a, b):
+        """Hamming distance between two perceptual hashes."""
+        return bin(a ^ b).count('1')
+
+
+def flatten_rgba(img):
+    """Drop the alpha band of an RGBA image, returning an RGB image."""
+    if img.mode != 'RGBA':
+        return img
+    
+    # Slicing the band out of the array view is a single vectorized copy
+    arr = np.asarray(img)
+    return Image.fromarray(arr[..., :3], 'RGB')
+
+
+def load_pdf_page(path):
+    """Open and fully decode an image for a PDF export, dropping any alpha band."""
+    img = Image.open(path)
+    img.load()
+    if img.mode == 'RGBA':
+        return flatten_rgba(img)
+    if img.mode not in ('1', 'L', 'RGB', 'CMYK'):
+        # Pillow writes other modes as hex text (P) or JPEG 2000 (LA); both are
+        # much slower and larger than the JPEG stream it uses for RGB
+        return img.convert('RGB')
+    return img
+
+
+# PDF colour spaces for the JPEG page streams, by image mode
+PDF_COLOR_SPACES = {'L': ('DeviceGray', 'ImageB'), 'RGB': ('DeviceRGB', 'ImageC'), 'CMYK': ('DeviceCMYK', 'ImageC')}
+
+
+def encode_pdf_page(path):
+    """Decode an export page and JPEG-encode it; returns (width, height, mode, data)."""
+    img = load_pdf_page(path)
+    if img.mode == '1':
+        img = img.convert('L')
+    buffer = io.BytesIO()
+    # Same DCT stream Pillow's own PDF writer produces for these modes
+    img.save(buffer, "JPEG")
+    page = (img.width, img.height, img.mode, buffer.getvalue())
+    img.close()
+    return page
+
+
+def write_image_pdf(save_path, paths, batch_size, report=None):
+    """Write one image per page to a PDF in a single pass.
+    
+    Pages are decoded and encoded batch_size at a time on a thread pool and
+    streamed straight to the file, so only one batch of compressed pages is
+    held in memory and the output is never re-opened or re-parsed.
+    """
+    with open(save_path, 'w+b') as f:
+        pdf = PdfParser.PdfParser(f=f, mode='w+b')
+        pdf.start_writing()
+        pdf.write_header()
+        pdf.info['Title'] = os.path.splitext(os.path.basename(save_path))[0]
+        pdf.info['CreationDate'] = pdf.info['ModDate'] = time.gmtime()
+        
+        # Reserve every page's objects so the page tree can be written first
+        page_objects = []
+        for _ in paths:
+            page_objects.append((pdf.next_object_id(0), pdf.next_object_id(0), pdf.next_object_id(0)))
+            pdf.pages.append(page_objects[-1][1])
+        pdf.write_catalog()
+        
+        # Decoding and JPEG encoding release the GIL, so each batch runs in parallel
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+            for start in range(0, len(paths), batch_size):
+                batch = paths[start:start + batch_size]
+                pages = zip(batch, page_objects[start:start + batch_size], pool.map(encode_pdf_page, batch))
+                for i, (path, (image_ref, page_ref, contents_ref), (width, height, mode, data)) in enumerate(pages, start + 1):
+                    color_space, procset = PDF_COLOR_SPACES[mode]
+                    pdf.write_obj(
+                        image_ref,
+                        stream=data,
+                        Type=PdfParser.PdfName("XObject"),
+                        Subtype=PdfParser.PdfName("Image"),
+                        Width=width,
+                        Height=height,
+                        Filter=PdfParser.PdfName("DCTDecode"),
+                        BitsPerComponent=8,
+                        ColorSpace=PdfParser.PdfName(color_space),
+                        # Pillow writes Adobe-style inverted CMYK JPEGs
+                        Decode=[1, 0, 1, 0, 1, 0, 1, 0] if mode == 'CMYK' else None,
+                    )
+                    # One pixel per point, as Pillow's writer does at its default 72 dpi
+                    pdf.write_page(
+                        page_ref,
+                        Resources=PdfParser.PdfDict(
+                            ProcSet=[PdfParser.PdfName("PDF"), PdfParser.PdfName(procset)],
+                            XObject=PdfParser.PdfDict(image=image_ref),
+                        ),
+                        MediaBox=[0, 0, width, height],
+                        Contents=contents_ref,
+                    )
+                    pdf.write_obj(contents_ref, stream=b"q %d 0 0 %d 0 0 cm /image Do Q\n" % (width, height))
+                    if report:
+                        report(i, f"Processing {i}/{len(paths)}: {path.name[:40]}...")
+        
+        pdf.write_xref_and_trailer()
+        pdf.close()
 
 
 def copy_image_to_clipboard(img):
@@ -941,15 +1373,14 @@ def copy_image_to_clipboard(img):
 
 def compress_image(img, quality=85):
     """Compress image to reduce file size."""
-    import io
-    
-    # Save to buffer with compression
+    # Save to buffer with compression. The buffer is decoded again right away, so
+    # skip optimize: the extra Huffman pass only shrinks bytes that are thrown away
     buffer = io.BytesIO()
-    img.save(buffer, format='JPEG', quality=quality, optimize=True)
+    img.save(buffer, format='JPEG', quality=quality)
     buffer.seek(0)
     
-    # Reload
-    return Image.open(buffer).convert('RGB')
+    # Reload (keeping grayscale captures single-channel)
+    return Image.open(buffer).convert('L' if img.mode == 'L' else 'RGB')
 
 
 def save_to_backup_folder(filepath, config):
@@ -991,32 +1422,77 @@ def run_post_capture_script(filepath, config):
         logger.error(f"Error running post-capture script: {e}")
 
 
+# Anything str.isalnum() rejects except space, '-', '_' and '.'
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-.]')
+
+
+def clean_filename(text):
+    """Strip characters that are not safe in file names."""
+    return _UNSAFE_FILENAME_CHARS.sub('', text).strip()
+
+
+_TEMPLATE_FIELD = re.compile(r'\{(document|datetime|date|time|year|month|day|hour|minute|second|ms)\}')
+
+
+@lru_cache(maxsize=8)
+def _compile_template(template):
+    """Split a filename template into alternating literal and field-name parts."""
+    # re.split with one group gives [literal, field, literal, field, ..., literal]
+    return tuple(_TEMPLATE_FIELD.split(template))
+
+
+def _template_value(field, doc_name, stamp, now):
+    """Resolve one template field; stamp is now formatted as %Y%m%d%H%M%S."""
+    if field == 'document':
+        return doc_name
+    if field == 'date':
+        return stamp[:8]
+    if field == 'time':
+        return stamp[8:]
+    if field == 'datetime':
+        return f"{stamp[:8]}_{stamp[8:]}"
+    if field == 'year':
+        return stamp[:4]
+    if field == 'month':
+        return stamp[4:6]
+    if field == 'day':
+        return stamp[6:8]
+    if field == 'hour':
+        return stamp[8:10]
+    if field == 'minute':
+        return stamp[10:12]
+    if field == 'second':
+        return stamp[12:14]
+    return f"{now.microsecond // 1000:03d}"  # ms
+
+
 def parse_filename_template(template, doc_name, config=None):
     """Parse filename template and return formatted filename."""
     now = datetime.now()
+    stamp = now.strftime('%Y%m%d%H%M%S')
     
-    replacements = {
-        '{document}': doc_name,
-        '{date}': now.strftime('%Y%m%d'),
-        '{time}': now.strftime('%H%M%S'),
-        '{datetime}': now.strftime('%Y%m%d_%H%M%S'),
-        '{year}': now.strftime('%Y'),
-        '{month}': now.strftime('%m'),
-        '{day}': now.strftime('%d'),
-        '{hour}': now.strftime('%H'),
-        '{minute}': now.strftime('%M'),
-        '{second}': now.strftime('%S'),
-        '{ms}': now.strftime('%f')[:3],
-    }
-    
-    result = template
-    for key, value in replacements.items():
-        result = result.replace(key, value)
+    parts = _compile_template(template)
+    if len(parts) == 1:
+        result = template
+    else:
+        pieces = list(parts)
+        for i in range(1, len(pieces), 2):
+            pieces[i] = _template_value(pieces[i], doc_name, stamp, now)
+        result = ''.join(pieces)
     
     # Clean filename of invalid characters
-    result = "".join(c for c in result if c.isalnum() or c in (' ', '-', '_', '.')).strip()
+    result = clean_filename(result)
     
-    return result if result else f"{doc_name}_{now.strftime('%Y%m%d_%H%M%S')}"
+    return result if result else f"{doc_name}_{stamp[:8]}_{stamp[8:]}"
+
+
+@lru_cache(maxsize=8)
+def _compile_filter(filter_patterns):
+    """Compile comma-separated patterns into one case-insensitive regex."""
+    patterns = [re.escape(p.strip().lower()) for p in filter_patterns.split(',') if p.strip()]
+    if not patterns:
+        return None
+    return re.compile('|'.join(patterns))
 
 
 def matches_filter(text, filter_patterns):
@@ -1024,42 +1500,80 @@ def matches_filter(text, filter_patterns):
     if not filter_patterns:
         return False
     
-    patterns = [p.strip().lower() for p in filter_patterns.split(',') if p.strip()]
-    text_lower = text.lower()
-    
-    for pattern in patterns:
-        if pattern in text_lower:
-            return True
-    return False
+    pattern = _compile_filter(filter_patterns)
+    return bool(pattern and pattern.search(text.lower()))
+
+
+def _scan_files(folder):
+    """Yield DirEntry objects for every file under folder, recursively."""
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _scan_files(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+                except OSError as e:
+                    logger.error(f"Error reading {entry.path}: {e}")
+    except OSError as e:
+        logger.error(f"Error scanning {folder}: {e}")
+
+
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.webp')
+
+
+def iter_images(folder):
+    """Yield a Path for every screenshot image under folder, in one directory walk."""
+    for entry in _scan_files(folder):
+        if entry.name.lower().endswith(IMAGE_SUFFIXES):
+            yield Path(entry.path)
+
+
+def path_sort_key(path):
+    """Sort key that orders paths like Path comparison, without a Python-level __lt__ per compare."""
+    return os.path.normcase(str(path)).split(os.sep)
 
 
 def cleanup_old_screenshots(folder, days):
     """Delete screenshots older than specified days."""
+    return _cleanup_scan(folder, days)[0]
+
+
+def _cleanup_scan(folder, days):
+    """Delete expired screenshots; return (deleted, oldest surviving mtime or None)."""
     if days <= 0:
-        return 0
+        return 0, None
     
     deleted = 0
-    cutoff = datetime.now() - timedelta(days=days)
-    folder_path = Path(folder)
+    oldest = None
+    cutoff = time.time() - days * 86400
     
-    if not folder_path.exists():
-        return 0
+    if not os.path.isdir(folder):
+        return 0, None
     
     try:
-        for file in folder_path.rglob('*'):
-            if file.is_file() and file.suffix.lower() in ['.png', '.jpg', '.jpeg']:
-                try:
-                    mtime = datetime.fromtimestamp(file.stat().st_mtime)
-                    if mtime < cutoff:
-                        file.unlink()
-                        deleted += 1
-                        logger.info(f"Cleaned up old screenshot: {file}")
-                except Exception as e:
-                    logger.error(f"Error deleting {file}: {e}")
+        for entry in _scan_files(folder):
+            # Check the extension before touching the file's metadata
+            if not entry.name.lower().endswith(IMAGE_SUFFIXES):
+                continue
+            try:
+                # On Windows the stat result comes with the directory listing
+                mtime = entry.stat().st_mtime
+                if mtime < cutoff:
+                    os.unlink(entry.path)
+                    deleted += 1
+                    logger.debug("Cleaned up old screenshot: %s", entry.path)
+                elif oldest is None or mtime < oldest:
+                    oldest = mtime
+            except Exception as e:
+                logger.error(f"Error deleting {entry.path}: {e}")
     except Exception as e:
         logger.error(f"Error during cleanup: {e}")
     
-    return deleted
+    if deleted:
+        logger.info(f"Cleaned up {deleted} screenshots older than {days} days in {folder}")
+    return deleted, oldest
 
 
 class SessionManager:
@@ -1116,7 +1630,42 @@ class AcrobatMonitor:
     """Monitors Adobe Acrobat for page navigation."""
     
     ACROBAT_TITLES = ['Adobe Acrobat', 'Adobe Reader', 'Acrobat Reader']
-    NAVIGATION_KEYS = [
+    
+    # Title endings of an Acrobat window with a document open
+    ACROBAT_SUFFIXES = (
+        ' - Adobe Acrobat Reader DC',
+        ' - Adobe Acrobat Reader',
+        ' - Adobe Acrobat Pro DC',
+        ' - Adobe Acrobat Pro',
+        ' - Adobe Acrobat DC',
+        ' - Adobe Acrobat',
+        ' - Acrobat Reader DC',
+        ' - Acrobat Reader',
+    )
+    
+    # Titles shown when Acrobat is open without a document
+    ACROBAT_HOME_TITLES = frozenset([
+        'Adobe Acrobat Reader', 'Adobe Acrobat', 'Adobe Acrobat Reader DC',
+        'Adobe Acrobat DC', 'Adobe Acrobat Pro DC', 'Adobe Acrobat Pro',
+        'Acrobat Reader DC', 'Acrobat Reader',
+        'Home', 'Home - Adobe Acrobat Reader DC', 'Home - Adobe Acrobat DC',
+        'Home - Adobe Acrobat Pro DC', 'Home - Adobe Acrobat Pro',
+    ])
+    
+    # Right-hand modifiers match as their left-hand twins, so each hotkey
+    # below is a single subset test. current_keys keeps the physical keys so
+    # releasing one of two held Ctrl (or Shift) keys leaves the other down.
+    MODIFIER_ALIASES = {
+        keyboard.Key.ctrl_r: keyboard.Key.ctrl_l,
+        keyboard.Key.shift_r: keyboard.Key.shift,
+    }
+    HOTKEY_MODIFIERS = frozenset([keyboard.Key.ctrl_l, keyboard.Key.shift])
+    HOTKEY_MANUAL = HOTKEY_MODIFIERS | {keyboard.KeyCode.from_char('s')}
+    HOTKEY_PAUSE = HOTKEY_MODIFIERS | {keyboard.KeyCode.from_char('p')}
+    HOTKEY_OPEN_FOLDER = HOTKEY_MODIFIERS | {keyboard.KeyCode.from_char('o')}
+    HOTKEY_OPEN_SETTINGS = HOTKEY_MODIFIERS | {keyboard.KeyCode.from_char(',')}
+    
+    NAVIGATION_KEYS = frozenset([
         keyboard.Key.page_down,
         keyboard.Key.page_up,
         keyboard.Key.down,
@@ -1125,7 +1674,20 @@ class AcrobatMonitor:
         keyboard.Key.right,
         keyboard.Key.home,
         keyboard.Key.end,
-    ]
+    ])
+    
+    STATUS_POLL_INTERVAL = 1.0  # Seconds between Acrobat focus checks
+    ACTIVE_CACHE_TTL = 0.1  # Seconds an active-window query is reused without the hook
+    
+    # WinEvents that can change the is_acrobat_active() answer
+    EVENT_SYSTEM_FOREGROUND = 0x0003
+    EVENT_SYSTEM_MINIMIZESTART = 0x0016
+    EVENT_SYSTEM_MINIMIZEEND = 0x0017
+    EVENT_OBJECT_NAMECHANGE = 0x800C
+    WINEVENT_OUTOFCONTEXT = 0x0000
+    WM_QUIT = 0x0012
+    HOOK_START_TIMEOUT = 2.0  # Seconds start() waits for the hook before polling instead
+    SCROLL_COALESCE_INTERVAL = 0.05  # Seconds to gather wheel notches before deciding
     
     def __init__(self, config, stats, session_manager, on_capture_callback=None, on_status_change=None, on_open_folder=None, on_open_settings=None):
         self.config = config
@@ -1137,45 +1699,199 @@ class AcrobatMonitor:
         self.on_open_settings = on_open_settings
         self.keyboard_listener = None
         self.mouse_listener = None
-        self.last_capture_time = 0
+        self.last_capture_time = float('-inf')  # time.monotonic() of the last capture
         self.last_window_title = ""
         self.screenshot_count = 0
         self.captured_page_hashes = {}  # Dict of {doc_name: list(hashes)} for duplicate detection
         self.max_hashes_per_document = 1000  # Limit hashes per document to prevent memory issues
         self.current_document = None  # Track current document for cleanup
-        self.pending_capture = None  # Track pending capture timer
+        self._delay_event = threading.Event()  # Set by schedule_capture, drained by _delay_worker
+        self._delay_thread = None
         self.capture_lock = threading.Lock()  # Thread safety
-        self.recent_captures = []  # Store recent capture paths
+        self.recent_captures = deque(maxlen=50)  # Store recent capture paths
         self.paused = False  # Pause/resume state
         self.document_capture_counts = {}  # Track captures per document
         self.accumulated_scroll = 0  # Track scroll distance
         self.folder_file_counts = {}  # Track files per folder
+        self._date_bucket = (None, '', 0.0)  # (date_format, folder name, valid until)
         
         # Manual hotkey tracking
         self.current_keys = set()
+        # Checked in order; a handler returns False to let the key fall through
+        self._hotkey_table = (
+            (self.HOTKEY_MANUAL, self._hotkey_manual_capture),
+            (self.HOTKEY_PAUSE, self._hotkey_pause),
+            (self.HOTKEY_OPEN_FOLDER, self._hotkey_open_folder),
+            (self.HOTKEY_OPEN_SETTINGS, self._hotkey_open_settings),
+        )
+        
+        # Status reporting (see refresh_status)
+        self.status = 'enabled'
+        self._status_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._health_thread = None
+        self._status_thread = None
+        
+        # Manual captures are handed to one long-lived worker
+        self._capture_queue = queue.Queue(maxsize=8)
+        self._capture_thread = None
+        self._scroll_event = threading.Event()  # Set by on_scroll, drained by _scroll_pump
+        self._scroll_thread = None
+        self._last_active = (float('-inf'), (False, "", None))  # (checked_at, result)
+        
+        # Foreground tracking: the hook bumps the generation whenever the
+        # foreground window (or its title) changes, so is_acrobat_active()
+        # only queries Windows again after a change
+        self._foreground_hwnd = None
+        self._foreground_generation = 0
+        self._active_generation = None
+        self._hook_thread = None
+        self._hook_thread_id = None
+        self._hook_installed = False
+        self._hook_ready = threading.Event()  # Set once the hook thread has installed or given up
+        
+        # Screen grabbing (DXcam when available, mss otherwise)
+        self._camera = None
+        # mss keeps its GDI handles per thread, so it is opened on the capture worker
+        self._sct = None
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="CaptureWriter")
+        self._grab_lock = threading.Lock()
+        self._grab_rect = None  # Last grabbed (left, top, width, height)
+        self._grab_monitor = None
+        self._grab_region_box = None
         
         # Health monitoring
         self.last_health_check = time.time()
         self.capture_errors = 0
         self.max_consecutive_errors = 10
         
+        # Settings read on every capture, refreshed when they change
+        self._cooldown = float(self.config.get('capture_cooldown'))
+        self.config.add_listener(self._on_config_changed)
+    
+    def _on_config_changed(self, keys):
+        """Refresh cached settings after a config change."""
+        if 'capture_cooldown' in keys:
+            self._cooldown = float(self.config.get('capture_cooldown'))
+        
     def _show_error_message(self, title, message):
-        """Show a user-friendly error message dialog."""
-        try:
-            import tkinter as tk
-            from tkinter import messagebox
-            root = tk.Tk()
-            root.withdraw()
-            root.attributes('-topmost', True)
-            messagebox.showerror(title, message, parent=root)
-            root.destroy()
-        except Exception as e:
-            logger.error(f"Failed to show error dialog: {e}")
-            # Fallback to console
-            print(f"ERROR: {title}\n{message}")
+        """Show a user-friendly error message dialog on the UI thread."""
+        def show():
+            try:
+                root = get_ui_root()
+                root.attributes('-topmost', True)
+                messagebox.showerror(title, message, parent=root)
+                root.attributes('-topmost', False)
+            except Exception as e:
+                logger.error(f"Failed to show error dialog: {e}")
+                # Fallback to console
+                print(f"ERROR: {title}\n{message}")
+        
+        # Called from the capture and writer threads; Tk must only be used on its own thread
+        run_on_ui(show)
         
     def is_acrobat_active(self):
         """Check if Adobe Acrobat is the active window WITH a PDF open."""
+        generation = self._foreground_generation
+        checked_at, last_result = self._last_active
+        if self._hook_installed:
+            if generation == self._active_generation:
+                # Nothing changed in the foreground since the last query
+                return last_result
+        else:
+            # No change notifications; reuse the answer within a key/scroll burst
+            now = time.monotonic()
+            if now - checked_at < self.ACTIVE_CACHE_TTL:
+                return last_result
+        
+        result = self._query_active_window()
+        # Publish as one tuple so readers never see a half-updated snapshot
+        self._last_active = (time.monotonic(), result)
+        self._active_generation = generation
+        return result
+    
+    def _start_foreground_hook(self):
+        """Start the thread that listens for foreground window changes."""
+        self._hook_thread = threading.Thread(target=self._run_foreground_hook, name="ForegroundHook", daemon=True)
+        self._hook_thread.start()
+        # Decide on the fallback here so stop() always sees _status_thread
+        self._hook_ready.wait(self.HOOK_START_TIMEOUT)
+        if not self._hook_installed:
+            logger.warning("Could not install foreground hook, polling the active window instead")
+            self._start_status_monitor()
+    
+    def _run_foreground_hook(self):
+        """Run the foreground hook, unblocking start() however setup ends."""
+        try:
+            self._pump_foreground_hook()
+        finally:
+            self._hook_ready.set()
+    
+    def _pump_foreground_hook(self):
+        """Register WinEvent hooks and pump messages until stop()."""
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+        
+        WinEventProc = ctypes.WINFUNCTYPE(
+            None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+            wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+        )
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.SetWinEventHook.argtypes = [
+            wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+            wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+        ]
+        user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+        
+        def on_event(hook, event, hwnd, id_object, id_child, thread_id, time_ms):
+            if event == self.EVENT_OBJECT_NAMECHANGE:
+                # Only the foreground window's own title matters (OBJID_WINDOW)
+                if id_object != 0 or hwnd != self._foreground_hwnd:
+                    return
+            elif event == self.EVENT_SYSTEM_FOREGROUND:
+                self._foreground_hwnd = hwnd
+            self._foreground_generation += 1
+            # Focus transitions drive the tray status; nothing polls for them
+            try:
+                self.refresh_status()
+            except Exception as e:
+                logger.debug(f"Status check error: {e}")
+        
+        callback = WinEventProc(on_event)
+        self._hook_thread_id = kernel32.GetCurrentThreadId()
+        self._foreground_hwnd = user32.GetForegroundWindow()
+        
+        hooks = []
+        for first, last in ((self.EVENT_SYSTEM_FOREGROUND, self.EVENT_SYSTEM_FOREGROUND),
+                            (self.EVENT_SYSTEM_MINIMIZESTART, self.EVENT_SYSTEM_MINIMIZEEND),
+                            (self.EVENT_OBJECT_NAMECHANGE, self.EVENT_OBJECT_NAMECHANGE)):
+            hook = user32.SetWinEventHook(first, last, None, callback, 0, 0, self.WINEVENT_OUTOFCONTEXT)
+            if not hook:
+                for installed in hooks:
+                    user32.UnhookWinEvent(installed)
+                return
+            hooks.append(hook)
+        
+        self._hook_installed = True
+        self._hook_ready.set()
+        logger.debug("Foreground hook installed")
+        try:
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            self._hook_installed = False
+            for hook in hooks:
+                user32.UnhookWinEvent(hook)
+    
+    @property
+    def acrobat_snapshot(self):
+        """Last (is_active, title, window) result, without querying Windows."""
+        return self._last_active[1]
+    
+    def _query_active_window(self):
+        """Inspect the foreground window for an Acrobat document."""
         try:
             active_window = gw.getActiveWindow()
             if not active_window:
@@ -1191,40 +1907,12 @@ class AcrobatMonitor:
             # We need to check that the title ENDS with an Adobe identifier to avoid false positives
             # (e.g., websites with "Adobe Acrobat" in the title)
             
-            # Check if title ends with an Adobe identifier (the real Acrobat pattern)
-            adobe_suffixes = [
-                ' - Adobe Acrobat Reader DC',
-                ' - Adobe Acrobat Reader',
-                ' - Adobe Acrobat Pro DC', 
-                ' - Adobe Acrobat Pro',
-                ' - Adobe Acrobat DC',
-                ' - Adobe Acrobat',
-                ' - Acrobat Reader DC',
-                ' - Acrobat Reader',
-            ]
-            
-            is_acrobat = any(title.endswith(suffix) for suffix in adobe_suffixes)
-            
-            # Also check for exact matches (app without document open)
-            just_app_names = ['Adobe Acrobat Reader', 'Adobe Acrobat', 'Adobe Acrobat Reader DC', 
-                              'Adobe Acrobat DC', 'Adobe Acrobat Pro DC', 'Adobe Acrobat Pro',
-                              'Acrobat Reader DC', 'Acrobat Reader']
-            
-            if title.strip() in just_app_names:
-                # App is open but no document - still counts as Acrobat being active
-                # but we won't capture (handled below)
-                is_acrobat = True
-            
-            if not is_acrobat:
+            # The app itself or its home screen is open, but no document
+            if title.strip() in self.ACROBAT_HOME_TITLES:
                 return False, "", None
             
-            # Check if an actual PDF is open (not just the app home screen)
-            home_screens = ['Home', 'Home - Adobe Acrobat Reader DC', 'Home - Adobe Acrobat DC',
-                            'Home - Adobe Acrobat Pro DC', 'Home - Adobe Acrobat Pro']
-            home_screens.extend(just_app_names)
-            
-            if title.strip() in home_screens:
-                # No document open, just the app home screen
+            # Check if title ends with an Adobe identifier (the real Acrobat pattern)
+            if not title.endswith(self.ACROBAT_SUFFIXES):
                 return False, "", None
             
             # Validate window dimensions are reasonable
@@ -1234,13 +1922,13 @@ class AcrobatMonitor:
                         logger.debug("Invalid window dimensions detected")
                         return False, "", None
             except (AttributeError, TypeError) as e:
-                logger.debug(f"Error checking window dimensions: {e}")
+                logger.debug("Error checking window dimensions: %s", e)
                 # Continue anyway, might still be valid
             
             # If we get here, Acrobat is open with a document
             return True, title, active_window
         except (AttributeError, TypeError, Exception) as e:
-            logger.debug(f"Error checking active window: {e}")
+            logger.debug("Error checking active window: %s", e)
             return False, "", None
     
     def check_filters(self, window_title):
@@ -1258,12 +1946,12 @@ class AcrobatMonitor:
         
         return True
     
-    def check_window_size(self, window):
-        """Check if window meets minimum size requirements."""
+    def check_window_size(self, box):
+        """Check if a window box meets minimum size requirements."""
         min_width = self.config.get('min_window_width')
         min_height = self.config.get('min_window_height')
         
-        if window.width < min_width or window.height < min_height:
+        if box.width < min_width or box.height < min_height:
             return False
         return True
     
@@ -1283,7 +1971,7 @@ class AcrobatMonitor:
             if separator in window_title:
                 doc_name = window_title.split(separator)[0].strip()
                 # Clean for filesystem
-                doc_name = "".join(c for c in doc_name if c.isalnum() or c in (' ', '-', '_', '.')).strip()
+                doc_name = clean_filename(doc_name)
                 return doc_name[:50]  # Limit length
         return "Unknown Document"
     
@@ -1300,16 +1988,15 @@ class AcrobatMonitor:
             img: PIL Image object
             
         Returns:
-            imagehash.ImageHash object
+            int perceptual hash (see perceptual_hash)
         """
-        hash_size = self.config.get('duplicate_hash_size')
-        return imagehash.phash(img, hash_size=hash_size)
+        return perceptual_hash(img, self.config.get('duplicate_hash_size'))
     
     def is_duplicate_page(self, current_hash, doc_name):
         """Check if a page with this hash (or similar) was already captured.
         
         Args:
-            current_hash: imagehash.ImageHash of the current screenshot
+            current_hash: perceptual hash of the current screenshot
             doc_name: Document name for scoping
             
         Returns:
@@ -1325,9 +2012,9 @@ class AcrobatMonitor:
         
         for existing_hash in self.captured_page_hashes[doc_name]:
             # Calculate Hamming distance between hashes
-            distance = current_hash - existing_hash
+            distance = hash_distance(current_hash, existing_hash)
             if distance <= threshold:
-                logger.debug(f"Found similar page (distance={distance}, threshold={threshold})")
+                logger.debug("Found similar page (distance=%s, threshold=%s)", distance, threshold)
                 return True
         
         return False
@@ -1336,7 +2023,7 @@ class AcrobatMonitor:
         """Add a page hash to the captured hashes for a document.
         
         Args:
-            current_hash: imagehash.ImageHash of the captured screenshot
+            current_hash: perceptual hash of the captured screenshot
             doc_name: Document name for scoping
         """
         if doc_name not in self.captured_page_hashes:
@@ -1374,14 +2061,11 @@ class AcrobatMonitor:
                 if len(self.captured_page_hashes[doc]) > 500:
                     self.captured_page_hashes[doc] = self.captured_page_hashes[doc][-500:]
     
-    def get_document_area(self, window):
-        """Try to estimate the document area within the Acrobat window."""
+    def get_document_area(self, box):
+        """Try to estimate the document area within an Acrobat window box."""
         # This is an approximation - Adobe Acrobat has toolbars at top and sides
         # We crop some pixels to try to get just the document
-        left = window.left
-        top = window.top
-        width = window.width
-        height = window.height
+        left, top, width, height = box
         
         # Approximate toolbar heights/widths (these vary by Acrobat version/config)
         top_offset = 120  # Top toolbar area
@@ -1398,7 +2082,11 @@ class AcrobatMonitor:
         return left, top, width, height
     
     def capture_screenshot(self, manual=False):
-        """Capture screenshot of the Acrobat window."""
+        """Capture screenshot of the Acrobat window.
+        
+        Returns the writer's Future, which resolves to the saved path (or None
+        if encoding or saving failed), or None if nothing was captured.
+        """
         with self.capture_lock:
             if self.paused and not manual:
                 return None
@@ -1423,25 +2111,25 @@ class AcrobatMonitor:
         
         # Check filters
         if not manual and not self.check_filters(window_title):
-            logger.debug(f"Document filtered out: {window_title}")
+            logger.debug("Document filtered out: %s", window_title)
             return None
         
+        # One GetWindowRect call; each of window.left/.top/.width/.height makes its own
+        box = window.box
+        
         # Check window size
-        if not self.check_window_size(window):
+        if not self.check_window_size(box):
             logger.debug("Window too small to capture")
             return None
         
-        doc_name = self.get_document_name(window_title)
-        
         # Check max captures per document
         if not manual and not self.check_max_captures(doc_name):
-            logger.debug(f"Max captures reached for: {doc_name}")
+            logger.debug("Max captures reached for: %s", doc_name)
             return None
         
         # Check cooldown
-        current_time = time.time()
-        cooldown = self.config.get('capture_cooldown')
-        if not manual and current_time - self.last_capture_time < cooldown:
+        current_time = time.monotonic()
+        if not manual and current_time - self.last_capture_time < self._cooldown:
             return None
         
         self.last_capture_time = current_time
@@ -1449,12 +2137,9 @@ class AcrobatMonitor:
         try:
             # Get window position and size
             if self.config.get('capture_document_only'):
-                left, top, width, height = self.get_document_area(window)
+                left, top, width, height = self.get_document_area(box)
             else:
-                left = window.left
-                top = window.top
-                width = window.width
-                height = window.height
+                left, top, width, height = box
             
             # Handle windows partially off-screen
             if left < 0:
@@ -1470,335 +2155,375 @@ class AcrobatMonitor:
                 return None
             
             # Capture the window region
-            with mss.mss() as sct:
-                monitor = {
-                    "left": left,
-                    "top": top,
-                    "width": width,
-                    "height": height
-                }
-                screenshot = sct.grab(monitor)
-                
-                # Convert to PIL Image for processing
-                img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-                
-                # Check for duplicate screenshot using perceptual hashing (skip for manual captures)
-                # This ensures we only capture when a new page is actually reached
-                # Perceptual hashing detects visually similar pages even with minor differences
-                if not manual and self.config.get('duplicate_detection_enabled'):
-                    current_hash = self.get_image_hash(img)
-                    
-                    # Check if this page (or a similar one) was already captured
-                    if self.is_duplicate_page(current_hash, doc_name):
-                        logger.debug(f"Skipping duplicate/similar page for '{doc_name}'")
-                        return None
-                    
-                    # Add hash to track this page as captured
-                    self.add_page_hash(current_hash, doc_name)
-                
-                # Apply custom crop margins first
-                img = apply_crop_margins(img, self.config)
-                
-                # Apply resolution scaling
-                img = apply_resolution_scale(img, self.config)
-                
-                # Apply grayscale if enabled
-                if self.config.get('grayscale_mode'):
-                    img = img.convert('L').convert('RGB')
+            img = self._grab_region(left, top, width, height)
+            if img is None:
+                logger.warning("Screen grab returned no frame")
+                return None
+            
+            # Check for duplicate screenshot using perceptual hashing (skip for manual captures)
+            # This ensures we only capture when a new page is actually reached
+            # Perceptual hashing detects visually similar pages even with minor differences
+            if not manual and self.config.get('duplicate_detection_enabled'):
+                current_hash = self.get_image_hash(img)
                 
-                # Resize if max dimensions are set
-                max_width = self.config.get('max_image_width')
-                max_height = self.config.get('max_image_height')
-                if max_width > 0 or max_height > 0:
-                    orig_width, orig_height = img.size
-                    new_width, new_height = orig_width, orig_height
-                    
-                    if max_width > 0 and orig_width > max_width:
-                        ratio = max_width / orig_width
-                        new_width = max_width
-                        new_height = int(orig_height * ratio)
-                    
-                    if max_height > 0 and new_height > max_height:
-                        ratio = max_height / new_height
-                        new_height = max_height
-                        new_width = int(new_width * ratio)
-                    
-                    if new_width != orig_width or new_height != orig_height:
-                        img = img.resize((new_width, new_height), Image.LANCZOS)
+                # Check if this page (or a similar one) was already captured
+                if self.is_duplicate_page(current_hash, doc_name):
+                    logger.debug("Skipping duplicate/similar page for '%s'", doc_name)
+                    return None
                 
-                # Add border if enabled
-                if self.config.get('add_border'):
-                    border_size = self.config.get('border_size')
-                    border_color = self.config.get('border_color')
-                    
-                    # Parse hex color
-                    try:
-                        if border_color.startswith('#'):
-                            border_color = border_color[1:]
-                        r = int(border_color[0:2], 16)
-                        g = int(border_color[2:4], 16)
-                        b = int(border_color[4:6], 16)
-                        color = (r, g, b)
-                    except:
-                        color = (255, 255, 255)
-                    
-                    new_width = img.width + (border_size * 2)
-                    new_height = img.height + (border_size * 2)
-                    bordered_img = Image.new('RGB', (new_width, new_height), color)
-                    bordered_img.paste(img, (border_size, border_size))
-                    img = bordered_img
+                # Add hash to track this page as captured
+                self.add_page_hash(current_hash, doc_name)
+            
+            # Apply custom crop margins first
+            img = apply_crop_margins(img, self.config)
+            
+            # Apply resolution scaling
+            img = apply_resolution_scale(img, self.config)
+            
+            # Apply grayscale if enabled
+            # Stays single-channel from here on: a third of the data to resize,
+            # and PNG/JPEG store it as grayscale (Pillow's WebP encoder expands it to RGB)
+            if self.config.get('grayscale_mode'):
+                img = img.convert('L')
+            
+            # Resize if max dimensions are set
+            max_width = self.config.get('max_image_width')
+            max_height = self.config.get('max_image_height')
+            if max_width > 0 or max_height > 0:
+                target = (max_width or img.width, max_height or img.height)
+                if img.width > target[0] or img.height > target[1]:
+                    # Resizes in place, keeps the aspect ratio; reducing_gap lets Pillow
+                    # shrink by whole factors first on large downscales
+                    img.thumbnail(target, get_resample_filter(self.config), reducing_gap=2.0)
+            
+            # Add border if enabled
+            if self.config.get('add_border'):
+                border_size = self.config.get('border_size')
+                color = border_fill(self.config.get('border_color'), img.mode)
                 
-                # Apply watermark
-                img = apply_watermark(img, self.config)
-                
-                # Auto-compress if enabled
-                if self.config.get('auto_compress'):
-                    compression_level = self.config.get('compression_level', 85)
-                    img = compress_image(img, compression_level)
-                
-                # Determine save location
-                base_folder = Path(self.config.get('save_folder'))
-                
-                # Check for session folder
-                session_folder = self.session_manager.get_session_folder()
-                if session_folder:
-                    save_folder = session_folder
-                else:
-                    save_folder = base_folder
-                
-                # Date-based organization
-                if self.config.get('organize_by_date'):
-                    date_format = self.config.get('date_folder_format')
-                    now = datetime.now()
-                    if date_format == 'monthly':
-                        date_folder = now.strftime('%Y-%m')
-                    elif date_format == 'weekly':
-                        date_folder = now.strftime('%Y-W%W')
-                    else:  # daily
-                        date_folder = now.strftime('%Y-%m-%d')
-                    save_folder = save_folder / date_folder
-                
-                # Document-based organization
-                if self.config.get('organize_by_document'):
-                    save_folder = save_folder / doc_name
-                
-                # Max files per folder
-                max_files = self.config.get('max_files_per_folder')
-                if max_files > 0:
+                new_width = img.width + (border_size * 2)
+                new_height = img.height + (border_size * 2)
+                bordered_img = Image.new(img.mode, (new_width, new_height), color)
+                bordered_img.paste(img, (border_size, border_size))
+                img = bordered_img
+            
+            # Apply watermark
+            img = apply_watermark(img, self.config)
+            
+            # Auto-compress if enabled
+            if self.config.get('auto_compress'):
+                compression_level = self.config.get('compression_level', 85)
+                img = compress_image(img, compression_level)
+            
+            # Determine save location
+            base_folder = Path(self.config.get('save_folder'))
+            
+            # Check for session folder
+            session_folder = self.session_manager.get_session_folder()
+            if session_folder:
+                save_folder = session_folder
+            else:
+                save_folder = base_folder
+            
+            # Date-based organization
+            if self.config.get('organize_by_date'):
+                save_folder = save_folder / self._date_folder(self.config.get('date_folder_format'))
+            
+            # Document-based organization
+            if self.config.get('organize_by_document'):
+                save_folder = save_folder / doc_name
+            
+            # Max files per folder
+            max_files = self.config.get('max_files_per_folder')
+            if max_files > 0:
+                folder_key = str(save_folder)
+                current_count = self.folder_file_counts.get(folder_key, 0)
+                if current_count >= max_files:
+                    subfolder_num = (current_count // max_files) + 1
+                    save_folder = save_folder / f"batch_{subfolder_num}"
                     folder_key = str(save_folder)
                     current_count = self.folder_file_counts.get(folder_key, 0)
-                    if current_count >= max_files:
-                        subfolder_num = (current_count // max_files) + 1
-                        save_folder = save_folder / f"batch_{subfolder_num}"
-                        folder_key = str(save_folder)
-                        current_count = self.folder_file_counts.get(folder_key, 0)
-                    self.folder_file_counts[folder_key] = current_count + 1
+                self.folder_file_counts[folder_key] = current_count + 1
+            
+            # Create save folder with error handling (only hits the disk once per folder)
+            try:
+                ensure_folder(save_folder)
+            except (OSError, PermissionError) as e:
+                error_msg = (
+                    f"Cannot create save folder:\n{save_folder}\n\n"
+                    f"Error: {str(e)}\n\n"
+                    "Please check:\n"
+                    "- Folder permissions\n"
+                    "- Disk space\n"
+                    "- Antivirus settings"
+                )
+                logger.error(f"Failed to create save folder: {e}")
+                if manual:
+                    self._show_error_message("Folder Creation Failed", error_msg)
+                return None
+            
+            # Generate filename using template
+            template = self.config.get('filename_template')
+            base_filename = parse_filename_template(template, doc_name, self.config)
+            
+            self.screenshot_count += 1
+            
+            # Update document capture count
+            self.document_capture_counts[doc_name] = self.document_capture_counts.get(doc_name, 0) + 1
+            
+            # Determine format and file name
+            img_format = self.config.get('image_format')
+            
+            if img_format == 'jpeg':
+                filename = f"{base_filename}.jpg"
+                filepath = save_folder / filename
+            elif img_format == 'webp':
+                filename = f"{base_filename}.webp"
+                filepath = save_folder / filename
+            else:  # png
+                filename = f"{base_filename}.png"
+                filepath = save_folder / filename
+            
+            # Encoding and disk I/O run on the writer thread so the next
+            # capture doesn't wait for PNG/JPEG compression
+            return self._writer.submit(self._encode_and_save, img, filepath, img_format, doc_name, manual)
                 
-                # Create save folder with error handling
+        except Exception as e:
+            logger.error(f"Error capturing screenshot: {e}")
+            return None
+    
+    def _date_folder(self, date_format):
+        """Name of the date folder for now, recomputed only when the period rolls over."""
+        cached_format, folder, expires_at = self._date_bucket
+        if cached_format == date_format and time.time() < expires_at:
+            return folder
+        
+        now = datetime.now()
+        midnight = datetime.combine(now.date(), datetime.min.time())
+        next_year = datetime(now.year + 1, 1, 1)
+        if date_format == 'monthly':
+            folder = now.strftime('%Y-%m')
+            expires = next_year if now.month == 12 else datetime(now.year, now.month + 1, 1)
+        elif date_format == 'weekly':
+            folder = now.strftime('%Y-W%W')
+            # %W weeks start on Monday, and the year part changes on Jan 1
+            expires = min(midnight + timedelta(days=7 - now.weekday()), next_year)
+        else:  # daily
+            folder = now.strftime('%Y-%m-%d')
+            expires = midnight + timedelta(days=1)
+        
+        self._date_bucket = (date_format, folder, expires.timestamp())
+        return folder
+    
+    def _encode_and_save(self, img, filepath, img_format, doc_name, manual):
+        """Encode a processed capture, write it, and run post-capture actions."""
+        try:
+            # Encode once in memory; retries below only repeat the disk write
+            buffer = io.BytesIO()
+            if img_format == 'jpeg':
+                img.save(buffer, "JPEG", quality=self.config.get('jpeg_quality'))
+            elif img_format == 'webp':
+                if self.config.get('webp_lossless'):
+                    # For lossless WebP, quality is encoder effort; 0 keeps it as fast as PNG level 1
+                    img.save(buffer, "WEBP", lossless=True, quality=0, method=1)
+                else:
+                    img.save(buffer, "WEBP", quality=self.config.get('jpeg_quality'))
+            else:  # png
+                img.save(buffer, "PNG", optimize=False, compress_level=self.config.get('png_compression_level'))
+            data = buffer.getvalue()
+            
+            # Save with retry logic for file I/O errors. Write under a .part name and
+            # rename, so folder watchers and sync tools never see a half-written image
+            max_retries = 3
+            saved = False
+            last_error = None
+            part_path = filepath.with_name(filepath.name + '.part')
+            
+            for attempt in range(max_retries):
                 try:
-                    save_folder.mkdir(parents=True, exist_ok=True)
-                except (OSError, PermissionError) as e:
-                    error_msg = (
-                        f"Cannot create save folder:\n{save_folder}\n\n"
-                        f"Error: {str(e)}\n\n"
-                        "Please check:\n"
-                        "- Folder permissions\n"
-                        "- Disk space\n"
-                        "- Antivirus settings"
-                    )
-                    logger.error(f"Failed to create save folder: {e}")
-                    if manual:
-                        self._show_error_message("Folder Creation Failed", error_msg)
-                    return None
-                
-                # Generate filename using template
-                template = self.config.get('filename_template')
-                base_filename = parse_filename_template(template, doc_name, self.config)
-                
-                self.screenshot_count += 1
-                
-                # Update document capture count
-                self.document_capture_counts[doc_name] = self.document_capture_counts.get(doc_name, 0) + 1
-                
-                # Determine format and save with retry logic
-                img_format = self.config.get('image_format')
-                
-                if img_format == 'jpeg':
-                    filename = f"{base_filename}.jpg"
-                    filepath = save_folder / filename
-                elif img_format == 'webp':
-                    filename = f"{base_filename}.webp"
-                    filepath = save_folder / filename
-                else:  # png
-                    filename = f"{base_filename}.png"
-                    filepath = save_folder / filename
-                
-                # Save with retry logic for file I/O errors
-                max_retries = 3
-                saved = False
-                last_error = None
-                
-                for attempt in range(max_retries):
-                    try:
-                        if img_format == 'jpeg':
-                            img.save(str(filepath), "JPEG", quality=self.config.get('jpeg_quality'))
-                        elif img_format == 'webp':
-                            img.save(str(filepath), "WEBP", quality=self.config.get('jpeg_quality'))
-                        else:  # png
-                            img.save(str(filepath), "PNG")
-                        saved = True
-                        break
-                    except (IOError, OSError, PermissionError) as e:
-                        last_error = e
+                    part_path.write_bytes(data)
+                    os.replace(part_path, filepath)
+                    saved = True
+                    break
+                except (IOError, OSError, PermissionError) as e:
+                    last_error = e
+                    # The capture and health threads read these too
+                    with self.capture_lock:
                         self.capture_errors += 1
-                        if attempt < max_retries - 1:
-                            time.sleep(0.1 * (attempt + 1))  # Exponential backoff
-                            logger.warning(f"Save attempt {attempt + 1} failed, retrying: {e}")
-                        else:
-                            logger.error(f"Failed to save screenshot after {max_retries} attempts: {e}")
-                            # Show user-friendly error
-                            if manual:
-                                self._show_error_message(
-                                    "Failed to Save Screenshot",
-                                    f"Could not save screenshot to:\n{filepath}\n\n"
-                                    f"Error: {str(e)}\n\n"
-                                    "Please check:\n"
-                                    "- Disk space is available\n"
-                                    "- Folder permissions are correct\n"
-                                    "- Antivirus isn't blocking the save"
-                                )
-                            # Health check: too many errors
-                            if self.capture_errors >= self.max_consecutive_errors:
-                                logger.error(f"Too many consecutive capture errors ({self.capture_errors}), pausing captures")
+                    if isinstance(e, FileNotFoundError):
+                        # Folder was removed since ensure_folder() saw it; recreate on retry
+                        forget_ensured_folders()
+                        try:
+                            ensure_folder(filepath.parent)
+                        except OSError:
+                            pass
+                    if attempt < max_retries - 1:
+                        time.sleep(0.1 * (attempt + 1))  # Exponential backoff
+                        logger.warning(f"Save attempt {attempt + 1} failed, retrying: {e}")
+                    else:
+                        logger.error(f"Failed to save screenshot after {max_retries} attempts: {e}")
+                        try:
+                            part_path.unlink()
+                        except OSError:
+                            pass
+                        # Show user-friendly error
+                        if manual:
+                            self._show_error_message(
+                                "Failed to Save Screenshot",
+                                f"Could not save screenshot to:\n{filepath}\n\n"
+                                f"Error: {str(e)}\n\n"
+                                "Please check:\n"
+                                "- Disk space is available\n"
+                                "- Folder permissions are correct\n"
+                                "- Antivirus isn't blocking the save"
+                            )
+                        # Health check: too many errors
+                        with self.capture_lock:
+                            errors = self.capture_errors
+                            if errors >= self.max_consecutive_errors:
                                 self.paused = True
-                                if self.on_status_change:
-                                    self.on_status_change("error")
-                            return None
-                
-                if not saved:
-                    return None
-                
-                # Reset error counter on success
+                        if errors >= self.max_consecutive_errors:
+                            logger.error(f"Too many consecutive capture errors ({errors}), pausing captures")
+                            self.refresh_status('error')
+                        return None
+            
+            if not saved:
+                return None
+            
+            # Reset error counter on success
+            with self.capture_lock:
                 self.capture_errors = 0
-                
-                logger.info(f"Screenshot saved: {filepath}")
-                
-                # Play sound if enabled
-                if self.config.get('sound_enabled'):
-                    play_capture_sound(self.config)
-                
-                # Auto-copy to clipboard if enabled
-                if self.config.get('auto_copy_clipboard'):
-                    copy_image_to_clipboard(img)
-                
-                # Save to backup folder if enabled
-                save_to_backup_folder(str(filepath), self.config)
-                
-                # Run post-capture script if enabled
-                run_post_capture_script(str(filepath), self.config)
-                
-                # Record in recent captures (limit to 50)
-                self.recent_captures.append({
-                    'path': str(filepath),
-                    'doc_name': doc_name,
-                    'timestamp': datetime.now().isoformat()
-                })
-                if len(self.recent_captures) > 50:
-                    self.recent_captures = self.recent_captures[-50:]
-                
-                # Add to session
-                self.session_manager.add_capture(str(filepath))
-                
-                # Record statistics
-                self.stats.record_capture(str(filepath), doc_name)
-                
-                if self.on_capture_callback:
-                    self.on_capture_callback(str(filepath), doc_name)
-                
-                return str(filepath)
-                
+            
+            logger.info("Screenshot saved: %s", filepath)
+            
+            # Play sound if enabled
+            if self.config.get('sound_enabled'):
+                play_capture_sound(self.config)
+            
+            # Auto-copy to clipboard if enabled
+            if self.config.get('auto_copy_clipboard'):
+                copy_image_to_clipboard(img)
+            
+            # Save to backup folder if enabled
+            save_to_backup_folder(str(filepath), self.config)
+            
+            # Run post-capture script if enabled
+            run_post_capture_script(str(filepath), self.config)
+            
+            # Record in recent captures (the deque drops the oldest past 50)
+            self.recent_captures.append({
+                'path': str(filepath),
+                'doc_name': doc_name,
+                'timestamp': datetime.now().isoformat()
+            })
+            
+            # Add to session
+            self.session_manager.add_capture(str(filepath))
+            
+            # Record statistics
+            self.stats.record_capture(str(filepath), doc_name)
+            
+            if self.on_capture_callback:
+                self.on_capture_callback(str(filepath), doc_name)
+            
+            return str(filepath)
         except Exception as e:
-            logger.error(f"Error capturing screenshot: {e}")
+            logger.error(f"Error saving screenshot: {e}")
             return None
     
     def schedule_capture(self):
         """Schedule a screenshot capture with delay (non-blocking)."""
-        # Cancel any pending capture to avoid duplicates
-        if self.pending_capture:
-            self.pending_capture.cancel()
-        
-        delay = self.config.get('capture_delay')
-        self.pending_capture = threading.Timer(delay, self.capture_screenshot)
-        self.pending_capture.daemon = True
-        self.pending_capture.start()
+        # _delay_worker restarts its wait on every call, so a burst of
+        # navigation events still results in a single capture
+        self._delay_event.set()
+    
+    def _delay_worker(self):
+        """Queue one capture once navigation has been quiet for capture_delay."""
+        while True:
+            self._delay_event.wait()
+            while True:
+                self._delay_event.clear()
+                if self._stop_event.wait(self.config.get('capture_delay')):
+                    return
+                if not self._delay_event.is_set():
+                    break
+            self.request_capture(manual=False)
+    
+    def _hotkey_manual_capture(self):
+        """Ctrl+Shift+S: queue a manual capture if the hotkey is enabled."""
+        if not self.config.get('hotkey_enabled'):
+            return False
+        logger.info("Manual capture hotkey triggered")
+        self.request_capture(manual=True)
+        return True
     
-    def check_manual_hotkey(self):
-        """Check if manual capture hotkey is pressed."""
-        ctrl_pressed = keyboard.Key.ctrl_l in self.current_keys or keyboard.Key.ctrl_r in self.current_keys
-        shift_pressed = keyboard.Key.shift in self.current_keys or keyboard.Key.shift_r in self.current_keys
-        s_pressed = keyboard.KeyCode.from_char('s') in self.current_keys
-        
-        return ctrl_pressed and shift_pressed and s_pressed
+    def _hotkey_pause(self):
+        """Ctrl+Shift+P: pause or resume capturing."""
+        self.toggle_pause()
+        return True
     
-    def check_pause_hotkey(self):
-        """Check if pause/resume hotkey is pressed."""
-        ctrl_pressed = keyboard.Key.ctrl_l in self.current_keys or keyboard.Key.ctrl_r in self.current_keys
-        shift_pressed = keyboard.Key.shift in self.current_keys or keyboard.Key.shift_r in self.current_keys
-        p_pressed = keyboard.KeyCode.from_char('p') in self.current_keys
-        
-        return ctrl_pressed and shift_pressed and p_pressed
+    def _hotkey_open_folder(self):
+        """Ctrl+Shift+O: open the screenshots folder."""
+        return self._start_callback(self.on_open_folder)
     
-    def check_open_folder_hotkey(self):
-        """Check if open folder hotkey is pressed."""
-        ctrl_pressed = keyboard.Key.ctrl_l in self.current_keys or keyboard.Key.ctrl_r in self.current_keys
-        shift_pressed = keyboard.Key.shift in self.current_keys or keyboard.Key.shift_r in self.current_keys
-        o_pressed = keyboard.KeyCode.from_char('o') in self.current_keys
-        
-        return ctrl_pressed and shift_pressed and o_pressed
+    def _hotkey_open_settings(self):
+        """Ctrl+Shift+,: open the settings window."""
+        return self._start_callback(self.on_open_settings)
     
-    def check_open_settings_hotkey(self):
-        """Check if open settings hotkey is pressed."""
-        ctrl_pressed = keyboard.Key.ctrl_l in self.current_keys or keyboard.Key.ctrl_r in self.current_keys
-        shift_pressed = keyboard.Key.shift in self.current_keys or keyboard.Key.shift_r in self.current_keys
-        comma_pressed = keyboard.KeyCode.from_char(',') in self.current_keys
-        
-        return ctrl_pressed and shift_pressed and comma_pressed
+    def _start_callback(self, callback):
+        """Run a UI callback off the input hook thread, if one is set."""
+        if not callback:
+            return False
+        threading.Thread(target=callback, daemon=True).start()
+        return True
     
     def toggle_pause(self):
         """Toggle pause/resume state."""
         self.paused = not self.paused
+        # Re-query the foreground window on the next check
+        self._last_active = (float('-inf'), self._last_active[1])
+        self._active_generation = None
         status = "paused" if self.paused else "resumed"
         logger.info(f"Capture {status}")
+        self.refresh_status()
+    
+    def get_status(self):
+        """Compute the current monitoring status."""
+        if self.paused:
+            return 'paused'
+        if not self.config.get('enabled'):
+            return 'disabled'
+        # With the hook, is_acrobat_active() only re-queries after a foreground
+        # change; without it, reuse a result the input handlers fetched this tick
+        checked_at, (is_active, _, _) = self._last_active
+        if self._hook_installed or time.monotonic() - checked_at >= self.STATUS_POLL_INTERVAL:
+            is_active, _, _ = self.is_acrobat_active()
+        return 'active' if is_active else 'enabled'
+    
+    def refresh_status(self, status=None):
+        """Recompute the status and notify the callback only if it changed."""
+        with self._status_lock:
+            if status is None:
+                status = self.get_status()
+            if status == self.status:
+                return
+            self.status = status
         if self.on_status_change:
-            self.on_status_change('paused' if self.paused else 'enabled')
+            self.on_status_change(status)
     
     def on_key_press(self, key):
         """Handle key press events (non-blocking)."""
         # Track current keys for hotkey detection
         self.current_keys.add(key)
+        held = {self.MODIFIER_ALIASES.get(k, k) for k in self.current_keys}
         
-        # Check for manual capture hotkey (Ctrl+Shift+S)
-        if self.config.get('hotkey_enabled') and self.check_manual_hotkey():
-            logger.info("Manual capture hotkey triggered")
-            threading.Thread(target=lambda: self.capture_screenshot(manual=True), daemon=True).start()
-            return
+        # Every hotkey is Ctrl+Shift+<key>; skip them all for plain key presses
+        if self.HOTKEY_MODIFIERS <= held:
+            for combo, handler in self._hotkey_table:
+                if combo <= held and handler():
+                    return
         
-        # Check for pause/resume hotkey (Ctrl+Shift+P)
-        if self.check_pause_hotkey():
-            self.toggle_pause()
-            return
-        
-        # Check for open folder hotkey (Ctrl+Shift+O)
-        if self.check_open_folder_hotkey() and self.on_open_folder:
-            threading.Thread(target=self.on_open_folder, daemon=True).start()
-            return
-        
-        # Check for open settings hotkey (Ctrl+Shift+,)
-        if self.check_open_settings_hotkey() and self.on_open_settings:
-            threading.Thread(target=self.on_open_settings, daemon=True).start()
-            return
-        
-        if not self.config.get('enabled') or self.paused:
+        if self.paused or not self.config.get('enabled'):
             return
         
         is_active, _, _ = self.is_acrobat_active()
@@ -1815,32 +2540,49 @@ class AcrobatMonitor:
     
     def on_scroll(self, x, y, dx, dy):
         """Handle mouse scroll events for PDF navigation."""
-        if not self.config.get('enabled') or self.paused:
-            return
-        
-        if not self.config.get('capture_on_scroll'):
+        if self.paused:
             return
         
-        is_active, _, _ = self.is_acrobat_active()
-        if not is_active:
-            return
-        
-        # Accumulate scroll distance
-        scroll_amount = abs(dy) * 30  # Approximate pixels per scroll tick
-        self.accumulated_scroll += scroll_amount
-        
-        # Check if we've scrolled enough
-        min_scroll = self.config.get('min_scroll_distance')
-        if self.accumulated_scroll >= min_scroll:
-            self.accumulated_scroll = 0
-            self.schedule_capture()
+        # Only accumulate here; _scroll_pump makes the capture decision so the
+        # input hook returns immediately on every wheel notch
+        self.accumulated_scroll += abs(dy) * 30  # Approximate pixels per scroll tick
+        self._scroll_event.set()
+    
+    def _scroll_pump(self):
+        """Turn accumulated scrolling into at most one capture decision per burst."""
+        while True:
+            self._scroll_event.wait()
+            if self._stop_event.is_set():
+                return
+            # Let the rest of the notches in this burst arrive
+            if self._stop_event.wait(self.SCROLL_COALESCE_INTERVAL):
+                return
+            self._scroll_event.clear()
+            
+            try:
+                if not self.config.get('enabled') or not self.config.get('capture_on_scroll'):
+                    self.accumulated_scroll = 0
+                    continue
+                
+                is_active, _, _ = self.is_acrobat_active()
+                if not is_active:
+                    self.accumulated_scroll = 0
+                    continue
+                
+                # Check if we've scrolled enough
+                min_scroll = self.config.get('min_scroll_distance')
+                if self.accumulated_scroll >= min_scroll:
+                    self.accumulated_scroll = 0
+                    self.schedule_capture()
+            except Exception as e:
+                logger.error(f"Scroll handling error: {e}")
     
     def on_click(self, x, y, button, pressed):
         """Handle mouse click events."""
         if not pressed:  # Only on button press, not release
             return
         
-        if not self.config.get('enabled') or self.paused:
+        if self.paused or not self.config.get('enabled'):
             return
         
         if not self.config.get('capture_on_click'):
@@ -1868,7 +2610,21 @@ class AcrobatMonitor:
             )
             self.mouse_listener.start()
             
-            # Start health monitoring thread
+            self._create_camera()
+            
+            self._capture_thread = threading.Thread(target=self._capture_worker, name="CaptureWorker")
+            self._capture_thread.start()
+            
+            self._delay_thread = threading.Thread(target=self._delay_worker, name="CaptureDelay")
+            self._delay_thread.start()
+            
+            self._scroll_thread = threading.Thread(target=self._scroll_pump, name="ScrollPump")
+            self._scroll_thread.start()
+            
+            # Focus changes update the status from the hook from here on
+            self.refresh_status()
+            self._start_foreground_hook()
+            
             self._start_health_monitor()
             
             logger.info("Monitoring started")
@@ -1876,22 +2632,86 @@ class AcrobatMonitor:
             logger.error(f"Failed to start monitoring: {e}")
             raise
     
+    def _create_camera(self):
+        """Create the DXcam camera, leaving mss as the backend if unavailable."""
+        if dxcam is None:
+            logger.info("dxcam not installed, using mss for screen capture")
+            return
+        try:
+            self._camera = dxcam.create(output_color="RGB")
+            logger.info("Using DXcam for screen capture")
+        except Exception as e:
+            self._camera = None
+            logger.warning(f"DXcam unavailable, using mss for screen capture: {e}")
+    
+    def _grab_region(self, left, top, width, height):
+        """Grab a screen region as an RGB image."""
+        with self._grab_lock:
+            # Rebuild the region only when the window moved or resized
+            rect = (left, top, width, height)
+            if rect != self._grab_rect:
+                self._grab_rect = rect
+                self._grab_monitor = {"left": left, "top": top, "width": width, "height": height}
+                self._grab_region_box = (left, top, left + width, top + height)
+            
+            if self._camera is not None:
+                try:
+                    frame = self._camera.grab(region=self._grab_region_box)
+                    if frame is not None:
+                        return Image.fromarray(frame)
+                    # No new frame since the last grab (screen unchanged)
+                except Exception as e:
+                    logger.debug(f"DXcam grab failed, falling back to mss: {e}")
+            
+            if self._sct is None:
+                self._sct = mss.mss()
+            screenshot = self._sct.grab(self._grab_monitor)
+            # .bgra would copy the buffer into a new bytes object first
+            return Image.frombytes("RGB", screenshot.size, screenshot.raw, "raw", "BGRX")
+    
+    def request_capture(self, manual=True):
+        """Queue a capture for the capture worker."""
+        try:
+            self._capture_queue.put_nowait(manual)
+        except queue.Full:
+            logger.warning("Capture queue full, ignoring capture request")
+    
+    def _capture_worker(self):
+        """Take queued capture requests one at a time."""
+        try:
+            while True:
+                manual = self._capture_queue.get()
+                if manual is None:
+                    return
+                try:
+                    self.capture_screenshot(manual=manual)
+                except Exception as e:
+                    logger.error(f"Queued capture failed: {e}")
+        finally:
+            # Close mss on the thread that opened it
+            with self._grab_lock:
+                if self._sct is not None:
+                    self._sct.close()
+                    self._sct = None
+    
     def _start_health_monitor(self):
         """Start background health monitoring thread."""
         def health_check():
-            while True:
-                time.sleep(60)  # Check every minute
+            while not self._stop_event.wait(60):  # Check every minute
                 try:
                     current_time = time.time()
                     # Reset error counter if no errors for 5 minutes
                     if current_time - self.last_health_check > 300:
-                        if self.capture_errors > 0:
-                            logger.info(f"Resetting error counter after 5 minutes of stability")
-                            self.capture_errors = 0
-                            if self.paused and self.capture_errors == 0:
+                        with self.capture_lock:
+                            had_errors = self.capture_errors > 0
+                            if had_errors:
+                                self.capture_errors = 0
+                                resumed = self.paused
                                 self.paused = False
-                                if self.on_status_change:
-                                    self.on_status_change("enabled")
+                        if had_errors:
+                            logger.info(f"Resetting error counter after 5 minutes of stability")
+                            if resumed:
+                                self.refresh_status()
                         self.last_health_check = current_time
                     
                     # Periodic hash cleanup
@@ -1901,17 +2721,48 @@ class AcrobatMonitor:
                 except Exception as e:
                     logger.debug(f"Health check error: {e}")
         
-        health_thread = threading.Thread(target=health_check, daemon=True)
-        health_thread.start()
+        self._health_thread = threading.Thread(target=health_check, name="HealthMonitor")
+        self._health_thread.start()
+    
+    def _start_status_monitor(self):
+        """Poll for Acrobat focus transitions when the foreground hook is unavailable."""
+        def status_check():
+            # Pause/enable changes are pushed from their handlers; only the
+            # Acrobat focus transition still needs to be sampled here.
+            while not self._stop_event.wait(self.STATUS_POLL_INTERVAL):
+                try:
+                    self.refresh_status()
+                except Exception as e:
+                    logger.debug(f"Status check error: {e}")
+        
+        self._status_thread = threading.Thread(target=status_check, name="StatusMonitor")
+        self._status_thread.start()
     
     def stop(self):
         """Stop monitoring."""
-        if self.pending_capture:
-            self.pending_capture.cancel()
+        self._stop_event.set()
         if self.keyboard_listener:
             self.keyboard_listener.stop()
         if self.mouse_listener:
             self.mouse_listener.stop()
+        if self._capture_thread:
+            self._capture_queue.put(None)
+        self._scroll_event.set()
+        self._delay_event.set()
+        if self._hook_thread_id:
+            ctypes.windll.user32.PostThreadMessageW(self._hook_thread_id, self.WM_QUIT, 0, 0)
+        for thread in (self._capture_thread, self._delay_thread, self._scroll_thread, self._hook_thread, self._health_thread, self._status_thread):
+            if thread and thread is not threading.current_thread():
+                thread.join(timeout=2.0)
+        # Let captures already handed to the writer finish saving
+        self._writer.shutdown(wait=True)
+        with self._grab_lock:
+            if self._camera is not None:
+                try:
+                    self._camera.release()
+                except Exception as e:
+                    logger.debug(f"Failed to release DXcam camera: {e}")
+                self._camera = None
         logger.info("Monitoring stopped")
     
     def clear_captured_hashes(self, doc_name=None):
@@ -1943,6 +2794,104 @@ class AcrobatMonitor:
         return sum(len(hashes) for hashes in self.captured_page_hashes.values())
 
 
+def center_window(window, width, height):
+    """Size a window and center it on screen without a layout pass."""
+    x = (window.winfo_screenwidth() - width) // 2
+    y = (window.winfo_screenheight() - height) // 2
+    window.geometry(f'{width}x{height}+{x}+{y}')
+
+
+def thin_rule(parent):
+    """Create a 1px horizontal rule; cheaper to draw than ttk.Separator's tiled image."""
+    return ttk.Frame(parent, height=1, style='Rule.TFrame')
+
+
+def grid_row(rows, label, field, hint=None, pady=5):
+    """Add a label, field and optional hint as the next row of a grid frame."""
+    row = rows.grid_size()[1]
+    ttk.Label(rows, text=label).grid(row=row, column=0, sticky=tk.W, pady=pady)
+    field.grid(row=row, column=1, sticky=tk.W, padx=5, pady=pady)
+    if hint:
+        ttk.Label(rows, text=hint).grid(row=row, column=2, sticky=tk.W, pady=pady)
+
+
+def read_number(var, config, key):
+    """Read an IntVar/DoubleVar, keeping the saved value if the field is empty or not a number."""
+    try:
+        return var.get()
+    except tk.TclError:
+        return config.get(key)
+
+
+_ui_root = None
+_ui_root_lock = threading.Lock()
+
+
+def get_ui_root():
+    """Get the hidden Tk root, starting the UI thread on first use.
+    
+    Tk may only be used from the thread that created it, so every app
+    window is a Toplevel of this root and is built on its thread.
+    """
+    with _ui_root_lock:
+        if _ui_root is None:
+            ready = threading.Event()
+            
+            def ui_loop():
+                global _ui_root
+                _ui_root = tk.Tk()
+                _ui_root.withdraw()
+                ready.set()
+                _ui_root.mainloop()
+            
+            threading.Thread(target=ui_loop, name="UIThread", daemon=True).start()
+            ready.wait()
+        return _ui_root
+
+
+def run_on_ui(func, *args):
+    """Schedule func(*args) to run on the UI thread."""
+    get_ui_root().after(0, func, *args)
+
+
+def configure_styles(master, is_dark):
+    """Configure the shared ttk styles used by the app windows.
+    
+    ttk styles live in the Tcl interpreter, so they only need to be set up
+    once per Tk root and again whenever the theme changes.
+    """
+    root = master._root()
+    if getattr(root, '_styled_dark', None) == is_dark:
+        return
+    
+    bg_color = '#1a1a2e' if is_dark else '#ffffff'
+    fg_color = '#e0e0e0' if is_dark else '#1a1a2e'
+    entry_bg = '#16213e' if is_dark else '#f5f5f5'
+    accent_color = '#4f46e5'
+    
+    style = ttk.Style(root)
+    style.theme_use('clam')
+    style.configure('TFrame', background=bg_color)
+    style.configure('TLabel', background=bg_color, foreground=fg_color)
+    style.configure('TButton', padding=5)
+    style.configure('TCheckbutton', background=bg_color, foreground=fg_color)
+    style.configure('TRadiobutton', background=bg_color, foreground=fg_color)
+    style.configure('TSpinbox', fieldbackground=entry_bg, foreground=fg_color)
+    style.configure('TEntry', fieldbackground=entry_bg, foreground=fg_color)
+    style.configure('TLabelframe', background=bg_color, foreground=fg_color)
+    style.configure('TLabelframe.Label', background=bg_color, foreground=accent_color, font=('Segoe UI', 10, 'bold'))
+    style.configure('TNotebook', background=bg_color)
+    style.configure('TNotebook.Tab', padding=[10, 5])
+    style.configure('Header.TLabel', font=('Segoe UI', 10, 'bold'), background=bg_color, foreground=accent_color)
+    style.configure('Title.TLabel', font=('Segoe UI', 16, 'bold'), background=bg_color, foreground='#ffffff' if is_dark else '#1a1a2e')
+    style.configure('Stat.TLabel', font=('Segoe UI', 24, 'bold'), background=bg_color, foreground=accent_color)
+    style.configure('StatLabel.TLabel', font=('Segoe UI', 9), background=bg_color, foreground='#888888')
+    style.configure('Danger.TButton', background='#ef4444')
+    style.configure('Rule.TFrame', background='#2a2a4a' if is_dark else '#d0d0d0')
+    
+    root._styled_dark = is_dark
+
+
 class FirstRunSetup:
     """First-run setup wizard shown on initial launch."""
     
@@ -1952,12 +2901,9 @@ class FirstRunSetup:
     
     def show(self):
         """Show the first-run setup wizard."""
-        import tkinter as tk
-        from tkinter import filedialog, ttk
-        
         self.window = tk.Tk()
         self.window.title("PDF Screenshot Tool - Welcome")
-        self.window.geometry("550x720")
+        center_window(self.window, 550, 720)
         self.window.resizable(False, False)
         
         # Apply dark theme
@@ -2124,14 +3070,6 @@ class FirstRunSetup:
         )
         start_btn.pack(pady=(25, 10))
         
-        # Center window
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'+{x}+{y}')
-        
         # Make it stay on top
         self.window.attributes('-topmost', True)
         self.window.focus_force()
@@ -2142,22 +3080,23 @@ class FirstRunSetup:
         return self.completed
     
     def browse_folder(self):
-        from tkinter import filedialog
-        folder = filedialog.askdirectory(initialdir=self.folder_var.get())
+        folder = filedialog.askdirectory(initialdir=self.folder_var.get(), parent=self.window, mustexist=True)
         if folder:
             self.folder_var.set(folder)
     
     def finish_setup(self):
-        # Save settings
-        self.config.set('save_folder', self.folder_var.get())
-        self.config.set('capture_on_scroll', self.scroll_var.get())
-        self.config.set('sound_enabled', self.sound_var.get())
-        self.config.set('show_notifications', self.notify_var.get())
-        
         # Handle startup setting
         if self.startup_var.get():
             set_startup_registry(True)
-        self.config.set('start_with_windows', self.startup_var.get())
+        
+        # Save settings
+        self.config.update({
+            'save_folder': self.folder_var.get(),
+            'capture_on_scroll': self.scroll_var.get(),
+            'sound_enabled': self.sound_var.get(),
+            'show_notifications': self.notify_var.get(),
+            'start_with_windows': self.startup_var.get(),
+        })
         
         self.completed = True
         self.window.destroy()
@@ -2174,9 +3113,6 @@ class RecentCapturesWindow:
     
     def show(self):
         """Show the recent captures window."""
-        import tkinter as tk
-        from tkinter import ttk
-        
         if self.window is not None:
             try:
                 self.window.lift()
@@ -2185,21 +3121,16 @@ class RecentCapturesWindow:
             except tk.TclError:
                 self.window = None
         
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(get_ui_root())
         self.window.title("Recent Captures")
-        self.window.geometry("700x500")
+        center_window(self.window, 700, 500)
         
         # Apply dark theme
         bg_color = '#1a1a2e' if self.config.get('dark_mode') else '#ffffff'
         fg_color = '#e0e0e0' if self.config.get('dark_mode') else '#1a1a2e'
         
         self.window.configure(bg=bg_color)
-        
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('TFrame', background=bg_color)
-        style.configure('TLabel', background=bg_color, foreground=fg_color)
-        style.configure('TButton', padding=5)
+        configure_styles(self.window, self.config.get('dark_mode'))
         
         main_frame = ttk.Frame(self.window, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -2248,17 +3179,9 @@ class RecentCapturesWindow:
         close_btn = ttk.Button(btn_frame, text="Close", command=self.close)
         close_btn.pack(side=tk.RIGHT)
         
-        # Center window
-        self.window.update_idletasks()
-        x = (self.window.winfo_screenwidth() // 2) - (350)
-        y = (self.window.winfo_screenheight() // 2) - (250)
-        self.window.geometry(f'+{x}+{y}')
-        
         self.window.protocol("WM_DELETE_WINDOW", self.close)
-        self.window.mainloop()
     
     def open_selected(self):
-        import subprocess
         selection = self.listbox.curselection()
         if selection:
             # Reverse index since list is reversed
@@ -2266,12 +3189,11 @@ class RecentCapturesWindow:
             if 0 <= idx < len(self.monitor.recent_captures):
                 filepath = self.monitor.recent_captures[idx]['path']
                 if Path(filepath).exists():
-                    subprocess.Popen(f'explorer /select,"{filepath}"')
+                    launch_detached(['explorer', '/select,', filepath])
     
     def open_folder(self):
-        import subprocess
         folder = self.config.get('save_folder')
-        subprocess.Popen(f'explorer "{folder}"')
+        launch_detached(['explorer', Path(folder)])
     
     def close(self):
         if self.window:
@@ -2289,9 +3211,6 @@ class StatisticsWindow:
     
     def show(self):
         """Show the statistics window."""
-        import tkinter as tk
-        from tkinter import ttk
-        
         if self.window is not None:
             try:
                 self.window.lift()
@@ -2300,25 +3219,16 @@ class StatisticsWindow:
             except tk.TclError:
                 self.window = None
         
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(get_ui_root())
         self.window.title("Statistics")
-        self.window.geometry("400x350")
+        center_window(self.window, 400, 350)
         self.window.resizable(False, False)
         
         # Apply dark theme
         bg_color = '#1a1a2e' if self.config.get('dark_mode') else '#ffffff'
-        fg_color = '#e0e0e0' if self.config.get('dark_mode') else '#1a1a2e'
-        accent_color = '#4f46e5'
         
         self.window.configure(bg=bg_color)
-        
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('TFrame', background=bg_color)
-        style.configure('TLabel', background=bg_color, foreground=fg_color)
-        style.configure('Title.TLabel', font=('Segoe UI', 14, 'bold'), background=bg_color, foreground='#ffffff')
-        style.configure('Stat.TLabel', font=('Segoe UI', 24, 'bold'), background=bg_color, foreground=accent_color)
-        style.configure('StatLabel.TLabel', font=('Segoe UI', 9), background=bg_color, foreground='#888888')
+        configure_styles(self.window, self.config.get('dark_mode'))
         
         main_frame = ttk.Frame(self.window, padding="30")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -2354,14 +3264,7 @@ class StatisticsWindow:
         close_btn = ttk.Button(main_frame, text="Close", command=self.close)
         close_btn.pack(pady=(30, 0))
         
-        # Center window
-        self.window.update_idletasks()
-        x = (self.window.winfo_screenwidth() // 2) - (200)
-        y = (self.window.winfo_screenheight() // 2) - (175)
-        self.window.geometry(f'+{x}+{y}')
-        
         self.window.protocol("WM_DELETE_WINDOW", self.close)
-        self.window.mainloop()
     
     def close(self):
         if self.window:
@@ -2372,15 +3275,17 @@ class StatisticsWindow:
 class BatchActionsWindow:
     """Window for batch actions on screenshots."""
     
+    PDF_PAGES_PER_WRITE = 32  # Pages decoded and encoded together during PDF export
+    PROGRESS_INTERVAL = 0.1  # Seconds between progress updates from a batch worker
+    
     def __init__(self, config):
         self.config = config
         self.window = None
+        self._action_buttons = []
+        self._batch_running = False
     
     def show(self):
         """Show the batch actions window."""
-        import tkinter as tk
-        from tkinter import ttk, messagebox, filedialog
-        
         if self.window is not None:
             try:
                 self.window.lift()
@@ -2389,25 +3294,16 @@ class BatchActionsWindow:
             except tk.TclError:
                 self.window = None
         
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(get_ui_root())
         self.window.title("Batch Actions")
-        self.window.geometry("450x400")
+        center_window(self.window, 450, 400)
         self.window.resizable(False, False)
         
         # Apply dark theme
         bg_color = '#1a1a2e' if self.config.get('dark_mode') else '#ffffff'
-        fg_color = '#e0e0e0' if self.config.get('dark_mode') else '#1a1a2e'
         
         self.window.configure(bg=bg_color)
-        
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('TFrame', background=bg_color)
-        style.configure('TLabel', background=bg_color, foreground=fg_color)
-        style.configure('TLabelframe', background=bg_color, foreground=fg_color)
-        style.configure('TLabelframe.Label', background=bg_color, foreground='#4f46e5', font=('Segoe UI', 10, 'bold'))
-        style.configure('Title.TLabel', font=('Segoe UI', 14, 'bold'), background=bg_color, foreground='#ffffff')
-        style.configure('Danger.TButton', background='#ef4444')
+        configure_styles(self.window, self.config.get('dark_mode'))
         
         main_frame = ttk.Frame(self.window, padding="30")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -2418,14 +3314,17 @@ class BatchActionsWindow:
         export_frame = ttk.LabelFrame(main_frame, text="Export", padding="15")
         export_frame.pack(fill=tk.X, pady=(0, 15))
         
-        ttk.Button(export_frame, text="Export All to ZIP", command=self.export_zip).pack(fill=tk.X, pady=5)
-        ttk.Button(export_frame, text="Export All to PDF", command=self.export_pdf).pack(fill=tk.X, pady=5)
+        zip_btn = ttk.Button(export_frame, text="Export All to ZIP", command=self.export_zip)
+        zip_btn.pack(fill=tk.X, pady=5)
+        pdf_btn = ttk.Button(export_frame, text="Export All to PDF", command=self.export_pdf)
+        pdf_btn.pack(fill=tk.X, pady=5)
         
         # Cleanup section
         cleanup_frame = ttk.LabelFrame(main_frame, text="Cleanup", padding="15")
         cleanup_frame.pack(fill=tk.X, pady=(0, 15))
         
-        ttk.Button(cleanup_frame, text="Delete Old Screenshots (30+ days)", command=self.delete_old).pack(fill=tk.X, pady=5)
+        delete_old_btn = ttk.Button(cleanup_frame, text="Delete Old Screenshots (30+ days)", command=self.delete_old)
+        delete_old_btn.pack(fill=tk.X, pady=5)
         
         delete_btn = tk.Button(
             cleanup_frame, 
@@ -2439,6 +3338,10 @@ class BatchActionsWindow:
         )
         delete_btn.pack(fill=tk.X, pady=5)
         
+        # Only one batch action may touch the folder at a time
+        self._action_buttons = [zip_btn, pdf_btn, delete_old_btn, delete_btn]
+        self._set_actions_enabled(not self._batch_running)
+        
         # Status
         self.status_var = tk.StringVar(value="")
         ttk.Label(main_frame, textvariable=self.status_var, font=('Segoe UI', 9)).pack(pady=10)
@@ -2446,32 +3349,104 @@ class BatchActionsWindow:
         # Close button
         ttk.Button(main_frame, text="Close", command=self.close).pack(pady=(10, 0))
         
-        # Center window
-        self.window.update_idletasks()
-        x = (self.window.winfo_screenwidth() // 2) - (225)
-        y = (self.window.winfo_screenheight() // 2) - (200)
-        self.window.geometry(f'+{x}+{y}')
-        
         self.window.protocol("WM_DELETE_WINDOW", self.close)
-        self.window.mainloop()
     
-    def export_zip(self):
-        from tkinter import filedialog, messagebox
+    def _show_progress(self, title, text, maximum):
+        """Open the modal progress dialog for a batch action."""
+        progress_window = tk.Toplevel(self.window)
+        progress_window.title(title)
+        progress_window.geometry("400x120")
+        progress_window.resizable(False, False)
+        progress_window.transient(self.window)
+        progress_window.grab_set()
+        # The worker closes it when the action finishes
+        progress_window.protocol("WM_DELETE_WINDOW", lambda: None)
+        
+        progress_label = ttk.Label(progress_window, text=text)
+        progress_label.pack(pady=10)
+        
+        progress_var = tk.DoubleVar()
+        progress_bar = ttk.Progressbar(progress_window, variable=progress_var, maximum=maximum, length=350)
+        progress_bar.pack(pady=10)
+        
+        status_label = ttk.Label(progress_window, text="")
+        status_label.pack(pady=5)
+        
+        return progress_window, progress_var, status_label
+    
+    def _set_actions_enabled(self, enabled):
+        for button in self._action_buttons:
+            if button.winfo_exists():
+                button.config(state=tk.NORMAL if enabled else tk.DISABLED)
+    
+    def _dialog_parent(self):
+        """Parent for result dialogs; the window may be closed while a batch runs."""
+        if self.window is not None and self.window.winfo_exists():
+            return self.window
+        return get_ui_root()
+    
+    def _run_batch(self, work, progress=None, error_text="Export failed"):
+        """Run work(report) on a worker thread so the UI keeps redrawing.
+        
+        work returns (status_text, success_message); report(i, text) posts
+        progress to the UI thread at most every PROGRESS_INTERVAL seconds.
+        """
+        last_report = [float('-inf')]
         
+        def report(i, text):
+            now = time.monotonic()
+            if progress is None or now - last_report[0] < self.PROGRESS_INTERVAL:
+                return
+            last_report[0] = now
+            run_on_ui(self._set_progress, progress, i, text)
+        
+        def worker():
+            try:
+                status_text, message = work(report)
+            except Exception as e:
+                logger.error(f"{error_text}: {e}")
+                run_on_ui(self._finish_batch, progress, f"Error: {e}", None, f"{error_text}: {e}")
+            else:
+                run_on_ui(self._finish_batch, progress, status_text, message, None)
+        
+        self._batch_running = True
+        self._set_actions_enabled(False)
+        threading.Thread(target=worker, name="BatchAction", daemon=True).start()
+    
+    def _set_progress(self, progress, i, text):
+        progress_window, progress_var, status_label = progress
+        if progress_window.winfo_exists():
+            progress_var.set(i)
+            status_label.config(text=text)
+    
+    def _finish_batch(self, progress, status_text, message, error):
+        if progress is not None and progress[0].winfo_exists():
+            progress[0].destroy()
+        self._batch_running = False
+        self._set_actions_enabled(True)
+        self.status_var.set(status_text)
+        parent = self._dialog_parent()
+        if error:
+            messagebox.showerror("Error", error, parent=parent)
+        else:
+            messagebox.showinfo("Success", message, parent=parent)
+    
+    def export_zip(self):
         folder = Path(self.config.get('save_folder'))
         if not folder.exists():
-            messagebox.showerror("Error", "Screenshot folder does not exist")
+            messagebox.showerror("Error", "Screenshot folder does not exist", parent=self.window)
             return
         
         # Get list of images
-        images = list(folder.rglob('*.png')) + list(folder.rglob('*.jpg')) + list(folder.rglob('*.jpeg'))
+        images = list(iter_images(folder))
         
         if not images:
-            messagebox.showinfo("Info", "No screenshots to export")
+            messagebox.showinfo("Info", "No screenshots to export", parent=self.window)
             return
         
         # Ask for save location
         save_path = filedialog.asksaveasfilename(
+            parent=self.window,
             defaultextension=".zip",
             filetypes=[("ZIP files", "*.zip")],
             initialfile=f"pdf_screenshots_{datetime.now().strftime('%Y%m%d')}.zip"
@@ -2480,61 +3455,40 @@ class BatchActionsWindow:
         if not save_path:
             return
         
-        try:
-            # Create progress window
-            progress_window = tk.Toplevel(self.window)
-            progress_window.title("Exporting...")
-            progress_window.geometry("400x120")
-            progress_window.resizable(False, False)
-            progress_window.transient(self.window)
-            progress_window.grab_set()
-            
-            progress_label = ttk.Label(progress_window, text=f"Exporting {len(images)} screenshots...")
-            progress_label.pack(pady=10)
-            
-            progress_var = tk.DoubleVar()
-            progress_bar = ttk.Progressbar(progress_window, variable=progress_var, maximum=len(images), length=350)
-            progress_bar.pack(pady=10)
-            
-            status_label = ttk.Label(progress_window, text="")
-            status_label.pack(pady=5)
-            
-            progress_window.update()
-            
+        progress = self._show_progress("Exporting...", f"Exporting {len(images)} screenshots...", len(images))
+        
+        def work(report):
             with zipfile.ZipFile(save_path, 'w', zipfile.ZIP_DEFLATED) as zf:
                 for i, img in enumerate(images, 1):
                     arcname = img.relative_to(folder)
-                    zf.write(img, arcname)
-                    progress_var.set(i)
-                    status_label.config(text=f"Processing {i}/{len(images)}: {img.name[:40]}...")
-                    progress_window.update()
-            
-            progress_window.destroy()
-            self.status_var.set(f"✓ Exported {len(images)} files to ZIP")
-            messagebox.showinfo("Success", f"Exported {len(images)} screenshots to:\n{save_path}")
-        except Exception as e:
-            if 'progress_window' in locals():
-                progress_window.destroy()
-            self.status_var.set(f"Error: {e}")
-            messagebox.showerror("Error", f"Export failed: {e}")
+                    # Image formats are already compressed; deflating them again costs
+                    # CPU for ~1% size, so store them as-is
+                    if img.suffix.lower() in PRECOMPRESSED_SUFFIXES:
+                        zip_add_file(zf, img, arcname, zipfile.ZIP_STORED)
+                    else:
+                        zip_add_file(zf, img, arcname)
+                    report(i, f"Processing {i}/{len(images)}: {img.name[:40]}...")
+            return (f"✓ Exported {len(images)} files to ZIP",
+                    f"Exported {len(images)} screenshots to:\n{save_path}")
+        
+        self._run_batch(work, progress)
     
     def export_pdf(self):
-        from tkinter import filedialog, messagebox
-        
         folder = Path(self.config.get('save_folder'))
         if not folder.exists():
-            messagebox.showerror("Error", "Screenshot folder does not exist")
+            messagebox.showerror("Error", "Screenshot folder does not exist", parent=self.window)
             return
         
         # Get list of images
-        images = sorted(list(folder.rglob('*.png')) + list(folder.rglob('*.jpg')) + list(folder.rglob('*.jpeg')))
+        images = sorted(iter_images(folder), key=path_sort_key)
         
         if not images:
-            messagebox.showinfo("Info", "No screenshots to export")
+            messagebox.showinfo("Info", "No screenshots to export", parent=self.window)
             return
         
         # Ask for save location
         save_path = filedialog.asksaveasfilename(
+            parent=self.window,
             defaultextension=".pdf",
             filetypes=[("PDF files", "*.pdf")],
             initialfile=f"pdf_screenshots_{datetime.now().strftime('%Y%m%d')}.pdf"
@@ -2543,106 +3497,73 @@ class BatchActionsWindow:
         if not save_path:
             return
         
-        try:
-            # Create progress window
-            progress_window = tk.Toplevel(self.window)
-            progress_window.title("Creating PDF...")
-            progress_window.geometry("400x120")
-            progress_window.resizable(False, False)
-            progress_window.transient(self.window)
-            progress_window.grab_set()
-            
-            progress_label = ttk.Label(progress_window, text=f"Converting {len(images)} screenshots to PDF...")
-            progress_label.pack(pady=10)
-            
-            progress_var = tk.DoubleVar()
-            progress_bar = ttk.Progressbar(progress_window, variable=progress_var, maximum=len(images), length=350)
-            progress_bar.pack(pady=10)
-            
-            status_label = ttk.Label(progress_window, text="")
-            status_label.pack(pady=5)
-            
-            progress_window.update()
-            
-            # Convert images to PDF
-            img_list = []
-            for i, img_path in enumerate(images, 1):
-                img = Image.open(img_path)
-                if img.mode == 'RGBA':
-                    img = img.convert('RGB')
-                img_list.append(img)
-                progress_var.set(i)
-                status_label.config(text=f"Processing {i}/{len(images)}: {img_path.name[:40]}...")
-                progress_window.update()
+        progress = self._show_progress("Creating PDF...", f"Converting {len(images)} screenshots to PDF...", len(images))
+        
+        def work(report):
+            # img2pdf copies JPEG streams into the PDF without decoding them
+            embedded = False
+            if img2pdf is not None and not any(p.suffix.lower() == '.webp' for p in images):  # img2pdf can't read WebP
+                report(0, "Saving PDF...")
+                try:
+                    with open(save_path, 'wb') as f:
+                        img2pdf.convert([str(p) for p in images], outputstream=f)
+                    embedded = True
+                except Exception as e:
+                    # e.g. images with an alpha channel, which img2pdf refuses
+                    logger.warning(f"img2pdf export failed, falling back to Pillow: {e}")
             
-            if img_list:
-                status_label.config(text="Saving PDF...")
-                progress_window.update()
-                img_list[0].save(save_path, save_all=True, append_images=img_list[1:])
+            if not embedded:
+                # One pass, streaming PDF_PAGES_PER_WRITE pages at a time
+                write_image_pdf(save_path, images, self.PDF_PAGES_PER_WRITE, report)
             
-            progress_window.destroy()
-            self.status_var.set(f"✓ Exported {len(images)} images to PDF")
-            messagebox.showinfo("Success", f"Exported {len(images)} screenshots to:\n{save_path}")
-        except Exception as e:
-            if 'progress_window' in locals():
-                progress_window.destroy()
-            self.status_var.set(f"Error: {e}")
-            messagebox.showerror("Error", f"Export failed: {e}")
+            return (f"✓ Exported {len(images)} images to PDF",
+                    f"Exported {len(images)} screenshots to:\n{save_path}")
+        
+        self._run_batch(work, progress)
     
     def delete_old(self):
-        from tkinter import messagebox
-        
         folder = self.config.get('save_folder')
         
-        if not messagebox.askyesno("Confirm", "Delete all screenshots older than 30 days?"):
+        if not messagebox.askyesno("Confirm", "Delete all screenshots older than 30 days?", parent=self.window):
             return
         
-        try:
-            self.status_var.set("Cleaning up...")
-            self.window.update()
-            
+        self.status_var.set("Cleaning up...")
+        
+        def work(report):
             deleted = cleanup_old_screenshots(folder, 30)
-            
-            self.status_var.set(f"✓ Deleted {deleted} old screenshots")
-            messagebox.showinfo("Success", f"Deleted {deleted} screenshots older than 30 days")
-        except Exception as e:
-            self.status_var.set(f"Error: {e}")
-            messagebox.showerror("Error", f"Cleanup failed: {e}")
+            return (f"✓ Deleted {deleted} old screenshots",
+                    f"Deleted {deleted} screenshots older than 30 days")
+        
+        self._run_batch(work, error_text="Cleanup failed")
     
     def delete_all(self):
-        from tkinter import messagebox
-        
         folder = Path(self.config.get('save_folder'))
         
-        if not messagebox.askyesno("⚠️ Warning", "This will DELETE ALL screenshots!\n\nAre you sure?"):
+        if not messagebox.askyesno("⚠️ Warning", "This will DELETE ALL screenshots!\n\nAre you sure?", parent=self.window):
             return
         
-        if not messagebox.askyesno("Final Confirmation", "This cannot be undone!\n\nProceed?"):
+        if not messagebox.askyesno("Final Confirmation", "This cannot be undone!\n\nProceed?", parent=self.window):
             return
         
-        try:
-            self.status_var.set("Deleting all...")
-            self.window.update()
-            
+        self.status_var.set("Deleting all...")
+        
+        def work(report):
+            # Bottom-up walk: each subfolder is emptied before we try to remove it
             count = 0
-            for file in folder.rglob('*'):
-                if file.is_file() and file.suffix.lower() in ['.png', '.jpg', '.jpeg']:
-                    file.unlink()
-                    count += 1
-            
-            # Remove empty directories
-            for dir_path in sorted(folder.rglob('*'), reverse=True):
-                if dir_path.is_dir():
+            for root, _, files in os.walk(folder, topdown=False):
+                for name in files:
+                    if name.lower().endswith(IMAGE_SUFFIXES):
+                        os.unlink(os.path.join(root, name))
+                        count += 1
+                if root != str(folder):
                     try:
-                        dir_path.rmdir()
+                        os.rmdir(root)
                     except OSError:
                         pass  # Directory not empty
-            
-            self.status_var.set(f"✓ Deleted {count} screenshots")
-            messagebox.showinfo("Success", f"Deleted {count} screenshots")
-        except Exception as e:
-            self.status_var.set(f"Error: {e}")
-            messagebox.showerror("Error", f"Delete failed: {e}")
+            forget_ensured_folders()
+            return f"✓ Deleted {count} screenshots", f"Deleted {count} screenshots"
+        
+        self._run_batch(work, error_text="Delete failed")
     
     def close(self):
         if self.window:
@@ -2661,9 +3582,6 @@ class SettingsWindow:
     
     def show(self):
         """Show the settings window."""
-        import tkinter as tk
-        from tkinter import filedialog, ttk
-        
         if self.window is not None:
             try:
                 self.window.lift()
@@ -2672,17 +3590,16 @@ class SettingsWindow:
             except tk.TclError:
                 self.window = None
         
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(get_ui_root())
+        # Stay unmapped while building so Tk lays the widgets out once, not per pack()
+        self.window.withdraw()
         self.window.title("PDF Screenshot Tool - Settings")
-        self.window.geometry("580x750")
+        center_window(self.window, 580, 750)
         self.window.resizable(False, False)
         
         # Apply theme
         is_dark = self.config.get('dark_mode')
         bg_color = '#1a1a2e' if is_dark else '#ffffff'
-        fg_color = '#e0e0e0' if is_dark else '#1a1a2e'
-        entry_bg = '#16213e' if is_dark else '#f5f5f5'
-        accent_color = '#4f46e5'
         
         self.window.configure(bg=bg_color)
         
@@ -2694,19 +3611,7 @@ class SettingsWindow:
         except Exception:
             pass
         
-        # Style
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        style.configure('TFrame', background=bg_color)
-        style.configure('TLabel', background=bg_color, foreground=fg_color, padding=5)
-        style.configure('TButton', padding=5)
-        style.configure('TCheckbutton', background=bg_color, foreground=fg_color, padding=5)
-        style.configure('TRadiobutton', background=bg_color, foreground=fg_color)
-        style.configure('TSpinbox', fieldbackground=entry_bg, foreground=fg_color)
-        style.configure('TEntry', fieldbackground=entry_bg, foreground=fg_color)
-        style.configure('Header.TLabel', font=('Segoe UI', 10, 'bold'), background=bg_color, foreground=accent_color)
-        style.configure('Title.TLabel', font=('Segoe UI', 16, 'bold'), background=bg_color, foreground='#ffffff' if is_dark else '#1a1a2e')
+        configure_styles(self.window, is_dark)
         
         # Create scrollable canvas
         canvas = tk.Canvas(self.window, bg=bg_color, highlightthickness=0)
@@ -2725,7 +3630,7 @@ class SettingsWindow:
         # Enable mouse wheel scrolling
         def on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+        self.window.bind("<MouseWheel>", on_mousewheel)
         
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -2736,7 +3641,7 @@ class SettingsWindow:
         
         # === Capture Settings ===
         ttk.Label(main_frame, text="Capture Settings", style='Header.TLabel').pack(anchor=tk.W)
-        ttk.Separator(main_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(main_frame).pack(fill=tk.X, pady=5)
         
         # Enable/Disable
         self.enabled_var = tk.BooleanVar(value=self.config.get('enabled'))
@@ -2799,7 +3704,7 @@ class SettingsWindow:
         
         ttk.Label(delay_frame, text="Capture delay:").pack(side=tk.LEFT)
         
-        self.delay_var = tk.StringVar(value=str(self.config.get('capture_delay')))
+        self.delay_var = tk.DoubleVar(value=self.config.get('capture_delay'))
         delay_spin = ttk.Spinbox(
             delay_frame, 
             from_=0.1, 
@@ -2813,7 +3718,7 @@ class SettingsWindow:
         
         # === Save Settings ===
         ttk.Label(main_frame, text="Save Settings", style='Header.TLabel').pack(anchor=tk.W, pady=(15, 0))
-        ttk.Separator(main_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(main_frame).pack(fill=tk.X, pady=5)
         
         # Save folder
         ttk.Label(main_frame, text="Save folder:").pack(anchor=tk.W)
@@ -2844,20 +3749,27 @@ class SettingsWindow:
         ttk.Label(format_frame, text="Image format:").pack(side=tk.LEFT)
         
         self.format_var = tk.StringVar(value=self.config.get('image_format'))
+        webp_radio = ttk.Radiobutton(format_frame, text="WebP (smallest)", variable=self.format_var, value='webp')
+        webp_radio.pack(side=tk.LEFT, padx=(10, 5))
         png_radio = ttk.Radiobutton(format_frame, text="PNG (lossless)", variable=self.format_var, value='png')
-        png_radio.pack(side=tk.LEFT, padx=(10, 5))
-        jpeg_radio = ttk.Radiobutton(format_frame, text="JPEG (smaller)", variable=self.format_var, value='jpeg')
-        jpeg_radio.pack(side=tk.LEFT, padx=5)
-        webp_radio = ttk.Radiobutton(format_frame, text="WebP (modern)", variable=self.format_var, value='webp')
-        webp_radio.pack(side=tk.LEFT)
+        png_radio.pack(side=tk.LEFT, padx=5)
+        jpeg_radio = ttk.Radiobutton(format_frame, text="JPEG (lossy)", variable=self.format_var, value='jpeg')
+        jpeg_radio.pack(side=tk.LEFT)
         
-        # Quality (for JPEG/WebP)
+        ttk.Label(
+            main_frame,
+            text="Lossless WebP keeps every pixel at about half the size of PNG; lossy WebP is smaller still, at the quality below.",
+            font=('Segoe UI', 8),
+            wraplength=500
+        ).pack(anchor=tk.W)
+        
+        # Quality (for JPEG/lossy WebP)
         quality_frame = ttk.Frame(main_frame)
         quality_frame.pack(fill=tk.X, pady=5)
         
-        ttk.Label(quality_frame, text="Quality (JPEG/WebP):").pack(side=tk.LEFT)
+        ttk.Label(quality_frame, text="Quality (JPEG/lossy WebP):").pack(side=tk.LEFT)
         
-        self.quality_var = tk.StringVar(value=str(self.config.get('jpeg_quality')))
+        self.quality_var = tk.IntVar(value=self.config.get('jpeg_quality'))
         quality_spin = ttk.Spinbox(
             quality_frame, 
             from_=50, 
@@ -2869,9 +3781,12 @@ class SettingsWindow:
         quality_spin.pack(side=tk.LEFT, padx=(10, 5))
         ttk.Label(quality_frame, text="%").pack(side=tk.LEFT)
         
+        self.webp_lossless_var = tk.BooleanVar(value=self.config.get('webp_lossless'))
+        ttk.Checkbutton(quality_frame, text="Lossless WebP", variable=self.webp_lossless_var).pack(side=tk.LEFT, padx=(20, 0))
+        
         # === Auto Cleanup ===
         ttk.Label(main_frame, text="Auto Cleanup", style='Header.TLabel').pack(anchor=tk.W, pady=(15, 0))
-        ttk.Separator(main_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(main_frame).pack(fill=tk.X, pady=5)
         
         self.cleanup_var = tk.BooleanVar(value=self.config.get('auto_cleanup_enabled'))
         cleanup_check = ttk.Checkbutton(
@@ -2886,7 +3801,7 @@ class SettingsWindow:
         
         ttk.Label(cleanup_days_frame, text="Delete screenshots older than:").pack(side=tk.LEFT)
         
-        self.cleanup_days_var = tk.StringVar(value=str(self.config.get('auto_cleanup_days')))
+        self.cleanup_days_var = tk.IntVar(value=self.config.get('auto_cleanup_days'))
         cleanup_days_spin = ttk.Spinbox(
             cleanup_days_frame, 
             from_=7, 
@@ -2900,7 +3815,7 @@ class SettingsWindow:
         
         # === System Settings ===
         ttk.Label(main_frame, text="System", style='Header.TLabel').pack(anchor=tk.W, pady=(15, 0))
-        ttk.Separator(main_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(main_frame).pack(fill=tk.X, pady=5)
         
         # Start with Windows
         self.startup_var = tk.BooleanVar(value=is_startup_enabled())
@@ -2965,77 +3880,72 @@ class SettingsWindow:
         close_btn = ttk.Button(btn_frame3, text="Close", command=self.close)
         close_btn.pack(side=tk.RIGHT)
         
-        # Center window
         self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'+{x}+{y}')
-        
+        self.window.deiconify()
         self.window.protocol("WM_DELETE_WINDOW", self.close)
-        self.window.mainloop()
     
     def toggle_enabled(self):
         self.config.set('enabled', self.enabled_var.get())
     
     def browse_folder(self):
-        from tkinter import filedialog
-        folder = filedialog.askdirectory(initialdir=self.folder_var.get())
+        folder = filedialog.askdirectory(initialdir=self.folder_var.get(), parent=self.window, mustexist=True)
         if folder:
             self.folder_var.set(folder)
     
     def save_settings(self):
-        self.config.set('save_folder', self.folder_var.get())
-        self.config.set('capture_delay', float(self.delay_var.get()))
-        self.config.set('enabled', self.enabled_var.get())
-        self.config.set('capture_on_scroll', self.scroll_var.get())
-        self.config.set('hotkey_enabled', self.hotkey_var.get())
-        self.config.set('show_notifications', self.notify_var.get())
-        self.config.set('sound_enabled', self.sound_var.get())
-        self.config.set('capture_document_only', self.doc_only_var.get())
-        self.config.set('organize_by_document', self.organize_var.get())
-        self.config.set('image_format', self.format_var.get())
-        self.config.set('jpeg_quality', int(self.quality_var.get()))
-        self.config.set('auto_cleanup_enabled', self.cleanup_var.get())
-        self.config.set('auto_cleanup_days', int(self.cleanup_days_var.get()))
-        self.config.set('dark_mode', self.dark_var.get())
+        # Read every field before changing anything, so a bad value can't leave
+        # the registry updated but the config unsaved
+        values = {
+            'save_folder': self.folder_var.get(),
+            'capture_delay': read_number(self.delay_var, self.config, 'capture_delay'),
+            'enabled': self.enabled_var.get(),
+            'capture_on_scroll': self.scroll_var.get(),
+            'hotkey_enabled': self.hotkey_var.get(),
+            'show_notifications': self.notify_var.get(),
+            'sound_enabled': self.sound_var.get(),
+            'capture_document_only': self.doc_only_var.get(),
+            'organize_by_document': self.organize_var.get(),
+            'image_format': self.format_var.get(),
+            'webp_lossless': self.webp_lossless_var.get(),
+            'jpeg_quality': read_number(self.quality_var, self.config, 'jpeg_quality'),
+            'auto_cleanup_enabled': self.cleanup_var.get(),
+            'auto_cleanup_days': read_number(self.cleanup_days_var, self.config, 'auto_cleanup_days'),
+            'dark_mode': self.dark_var.get(),
+            'start_with_windows': self.startup_var.get(),
+        }
         
         # Handle startup setting
-        set_startup_registry(self.startup_var.get())
-        self.config.set('start_with_windows', self.startup_var.get())
+        set_startup_registry(values['start_with_windows'])
+        self.config.update(values)
         
         # Update status
+        summary = self.stats.get_summary()
+        summary_text = f"Session: {summary['session_captures']} | Total: {summary['total_captures']}"
         self.status_label.config(text="✓ Settings saved!")
-        self.window.after(2000, lambda: self.status_label.config(
-            text=f"Session: {self.stats.get_summary()['session_captures']} | Total: {self.stats.get_summary()['total_captures']}"
-        ))
+        self.window.after(2000, lambda: self.status_label.config(text=summary_text))
     
     def open_folder(self):
-        import subprocess
-        folder = self.config.get('save_folder')
-        Path(folder).mkdir(parents=True, exist_ok=True)
-        subprocess.Popen(f'explorer "{folder}"')
+        folder = ensure_folder(self.config.get('save_folder'))
+        launch_detached(['explorer', Path(folder)])
     
     def open_log(self):
-        import subprocess
-        subprocess.Popen(f'notepad "{LOG_FILE}"')
+        launch_detached(['notepad', LOG_FILE])
     
     def show_stats(self):
         stats_window = StatisticsWindow(self.stats, self.config)
-        threading.Thread(target=stats_window.show, daemon=True).start()
+        self.window.after(0, stats_window.show)
     
     def show_recent(self):
         recent_window = RecentCapturesWindow(self.monitor, self.config)
-        threading.Thread(target=recent_window.show, daemon=True).start()
+        self.window.after(0, recent_window.show)
     
     def show_batch(self):
         batch_window = BatchActionsWindow(self.config)
-        threading.Thread(target=batch_window.show, daemon=True).start()
+        self.window.after(0, batch_window.show)
     
     def show_advanced(self):
         advanced_window = AdvancedSettingsWindow(self.config, self.monitor)
-        threading.Thread(target=advanced_window.show, daemon=True).start()
+        self.window.after(0, advanced_window.show)
     
     def close(self):
         if self.window:
@@ -3053,9 +3963,6 @@ class AdvancedSettingsWindow:
     
     def show(self):
         """Show the advanced settings window."""
-        import tkinter as tk
-        from tkinter import ttk, filedialog
-        
         if self.window is not None:
             try:
                 self.window.lift()
@@ -3064,101 +3971,113 @@ class AdvancedSettingsWindow:
             except tk.TclError:
                 self.window = None
         
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(get_ui_root())
+        # Stay unmapped while building so Tk lays the widgets out once, not per pack()
+        self.window.withdraw()
         self.window.title("Advanced Settings")
-        self.window.geometry("650x700")
+        center_window(self.window, 650, 700)
         
         # Apply theme
         is_dark = self.config.get('dark_mode')
         bg_color = '#1a1a2e' if is_dark else '#ffffff'
-        fg_color = '#e0e0e0' if is_dark else '#1a1a2e'
-        entry_bg = '#16213e' if is_dark else '#f5f5f5'
-        accent_color = '#4f46e5'
         
         self.window.configure(bg=bg_color)
+        configure_styles(self.window, is_dark)
         
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('TFrame', background=bg_color)
-        style.configure('TLabel', background=bg_color, foreground=fg_color)
-        style.configure('TCheckbutton', background=bg_color, foreground=fg_color)
-        style.configure('TEntry', fieldbackground=entry_bg)
-        style.configure('Header.TLabel', font=('Segoe UI', 10, 'bold'), background=bg_color, foreground=accent_color)
-        style.configure('TNotebook', background=bg_color)
-        style.configure('TNotebook.Tab', padding=[10, 5])
-        
-        # Create notebook (tabs)
+        # Create notebook (tabs). Each tab's widgets are built the first time it is
+        # selected, so opening the window only builds the first one
         notebook = ttk.Notebook(self.window)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # === Capture Tab ===
-        capture_frame = ttk.Frame(notebook, padding=15)
-        notebook.add(capture_frame, text="Capture")
+        self._built_tabs = set()
+        self._tab_builders = {}
+        for name, builder in (
+            ('Capture', self._build_capture_tab),
+            ('Image', self._build_image_tab),
+            ('Files', self._build_files_tab),
+            ('Filters', self._build_filters_tab),
+            ('Notifications', self._build_notifications_tab),
+            ('Watermark', self._build_watermark_tab),
+            ('Cropping', self._build_cropping_tab),
+            ('Actions', self._build_actions_tab),
+            ('Performance', self._build_performance_tab),
+            ('Updates', self._build_updates_tab),
+        ):
+            frame = ttk.Frame(notebook, padding=15)
+            notebook.add(frame, text=name)
+            self._tab_builders[str(frame)] = (name, builder, frame)
+        
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self._on_tab_changed(None, notebook)
         
+        # Save/Close buttons
+        btn_frame = ttk.Frame(self.window)
+        btn_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        ttk.Button(btn_frame, text="Save All", command=self.save_all).pack(side=tk.LEFT)
+        ttk.Button(btn_frame, text="Close", command=self.close).pack(side=tk.RIGHT)
+        
+        self.window.update_idletasks()
+        self.window.deiconify()
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+    
+    def _on_tab_changed(self, event, notebook=None):
+        """Build the selected tab's widgets the first time it is shown."""
+        notebook = notebook or event.widget
+        name, builder, frame = self._tab_builders[notebook.select()]
+        if name not in self._built_tabs:
+            self._built_tabs.add(name)
+            builder(frame)
+    
+    def _build_capture_tab(self, capture_frame):
+        """Build the Capture tab."""
         ttk.Label(capture_frame, text="Capture Behavior", style='Header.TLabel').pack(anchor=tk.W)
-        ttk.Separator(capture_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(capture_frame).pack(fill=tk.X, pady=5)
         
         self.click_var = tk.BooleanVar(value=self.config.get('capture_on_click'))
         ttk.Checkbutton(capture_frame, text="Capture on mouse click in Acrobat", variable=self.click_var).pack(anchor=tk.W)
         
+        rows = ttk.Frame(capture_frame)
+        rows.pack(fill=tk.X)
+        
         # Cooldown
-        cooldown_frame = ttk.Frame(capture_frame)
-        cooldown_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(cooldown_frame, text="Capture cooldown:").pack(side=tk.LEFT)
-        self.cooldown_var = tk.StringVar(value=str(self.config.get('capture_cooldown')))
-        ttk.Spinbox(cooldown_frame, from_=0.1, to=5.0, increment=0.1, textvariable=self.cooldown_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(cooldown_frame, text="seconds").pack(side=tk.LEFT)
+        self.cooldown_var = tk.DoubleVar(value=self.config.get('capture_cooldown'))
+        grid_row(rows, "Capture cooldown:", ttk.Spinbox(rows, from_=0.1, to=5.0, increment=0.1, textvariable=self.cooldown_var, width=8), "seconds")
         
         # Min scroll distance
-        scroll_frame = ttk.Frame(capture_frame)
-        scroll_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(scroll_frame, text="Min scroll distance:").pack(side=tk.LEFT)
-        self.min_scroll_var = tk.StringVar(value=str(self.config.get('min_scroll_distance')))
-        ttk.Spinbox(scroll_frame, from_=10, to=200, increment=10, textvariable=self.min_scroll_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(scroll_frame, text="pixels").pack(side=tk.LEFT)
+        self.min_scroll_var = tk.IntVar(value=self.config.get('min_scroll_distance'))
+        grid_row(rows, "Min scroll distance:", ttk.Spinbox(rows, from_=10, to=200, increment=10, textvariable=self.min_scroll_var, width=8), "pixels")
         
         # Max captures per document
-        max_frame = ttk.Frame(capture_frame)
-        max_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(max_frame, text="Max captures per document:").pack(side=tk.LEFT)
-        self.max_captures_var = tk.StringVar(value=str(self.config.get('max_captures_per_document')))
-        ttk.Spinbox(max_frame, from_=0, to=1000, increment=10, textvariable=self.max_captures_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(max_frame, text="(0 = unlimited)").pack(side=tk.LEFT)
+        self.max_captures_var = tk.IntVar(value=self.config.get('max_captures_per_document'))
+        grid_row(rows, "Max captures per document:", ttk.Spinbox(rows, from_=0, to=1000, increment=10, textvariable=self.max_captures_var, width=8), "(0 = unlimited)")
         
         # === Duplicate Detection Section ===
         ttk.Label(capture_frame, text="Duplicate Detection", style='Header.TLabel').pack(anchor=tk.W, pady=(15, 0))
-        ttk.Separator(capture_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(capture_frame).pack(fill=tk.X, pady=5)
         
         self.dup_detect_var = tk.BooleanVar(value=self.config.get('duplicate_detection_enabled'))
         ttk.Checkbutton(capture_frame, text="Enable smart duplicate detection (skip already-captured pages)", variable=self.dup_detect_var).pack(anchor=tk.W)
         
+        rows = ttk.Frame(capture_frame)
+        rows.pack(fill=tk.X)
+        
         # Similarity threshold
-        thresh_frame = ttk.Frame(capture_frame)
-        thresh_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(thresh_frame, text="Similarity threshold:").pack(side=tk.LEFT)
-        self.dup_thresh_var = tk.StringVar(value=str(self.config.get('duplicate_similarity_threshold')))
-        ttk.Spinbox(thresh_frame, from_=0, to=20, increment=1, textvariable=self.dup_thresh_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(thresh_frame, text="(0=exact, 5=recommended, higher=more lenient)").pack(side=tk.LEFT)
+        self.dup_thresh_var = tk.IntVar(value=self.config.get('duplicate_similarity_threshold'))
+        grid_row(rows, "Similarity threshold:", ttk.Spinbox(rows, from_=0, to=20, increment=1, textvariable=self.dup_thresh_var, width=8), "(0=exact, 5=recommended, higher=more lenient)")
         
         # Hash precision
-        hash_frame = ttk.Frame(capture_frame)
-        hash_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(hash_frame, text="Detection precision:").pack(side=tk.LEFT)
-        self.dup_hash_var = tk.StringVar(value=str(self.config.get('duplicate_hash_size')))
-        hash_combo = ttk.Combobox(hash_frame, textvariable=self.dup_hash_var, values=['8', '16', '32'], width=6, state='readonly')
-        hash_combo.pack(side=tk.LEFT, padx=5)
-        ttk.Label(hash_frame, text="(8=fast, 16=balanced, 32=precise)").pack(side=tk.LEFT)
+        self.dup_hash_var = tk.IntVar(value=self.config.get('duplicate_hash_size'))
+        grid_row(rows, "Detection precision:", ttk.Combobox(rows, textvariable=self.dup_hash_var, values=['8', '16', '32'], width=6, state='readonly'), "(8=fast, 16=balanced, 32=precise)")
         
         # Clear hashes button
         clear_btn = ttk.Button(capture_frame, text="Clear Captured Page History", command=self.clear_page_hashes)
         clear_btn.pack(anchor=tk.W, pady=10)
-        
-        # === Image Tab ===
-        image_frame = ttk.Frame(notebook, padding=15)
-        notebook.add(image_frame, text="Image")
-        
+    
+    def _build_image_tab(self, image_frame):
+        """Build the Image tab."""
         ttk.Label(image_frame, text="Image Processing", style='Header.TLabel').pack(anchor=tk.W)
-        ttk.Separator(image_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(image_frame).pack(fill=tk.X, pady=5)
         
         self.grayscale_var = tk.BooleanVar(value=self.config.get('grayscale_mode'))
         ttk.Checkbutton(image_frame, text="Convert to grayscale (smaller files)", variable=self.grayscale_var).pack(anchor=tk.W)
@@ -3166,43 +4085,44 @@ class AdvancedSettingsWindow:
         self.border_var = tk.BooleanVar(value=self.config.get('add_border'))
         ttk.Checkbutton(image_frame, text="Add border around captures", variable=self.border_var).pack(anchor=tk.W)
         
-        border_size_frame = ttk.Frame(image_frame)
-        border_size_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(border_size_frame, text="Border size:").pack(side=tk.LEFT)
-        self.border_size_var = tk.StringVar(value=str(self.config.get('border_size')))
-        ttk.Spinbox(border_size_frame, from_=1, to=50, increment=1, textvariable=self.border_size_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(border_size_frame, text="pixels").pack(side=tk.LEFT)
+        rows = ttk.Frame(image_frame)
+        rows.pack(fill=tk.X)
+        
+        self.border_size_var = tk.IntVar(value=self.config.get('border_size'))
+        grid_row(rows, "Border size:", ttk.Spinbox(rows, from_=1, to=50, increment=1, textvariable=self.border_size_var, width=8), "pixels")
         
-        border_color_frame = ttk.Frame(image_frame)
-        border_color_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(border_color_frame, text="Border color:").pack(side=tk.LEFT)
         self.border_color_var = tk.StringVar(value=self.config.get('border_color'))
-        ttk.Entry(border_color_frame, textvariable=self.border_color_var, width=10).pack(side=tk.LEFT, padx=5)
-        ttk.Label(border_color_frame, text="(hex, e.g. #ffffff)").pack(side=tk.LEFT)
+        grid_row(rows, "Border color:", ttk.Entry(rows, textvariable=self.border_color_var, width=10), "(hex, e.g. #ffffff)")
         
         ttk.Label(image_frame, text="Max Dimensions (0 = no limit)", style='Header.TLabel').pack(anchor=tk.W, pady=(15, 0))
-        ttk.Separator(image_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
-        
-        max_width_frame = ttk.Frame(image_frame)
-        max_width_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(max_width_frame, text="Max width:").pack(side=tk.LEFT)
-        self.max_width_var = tk.StringVar(value=str(self.config.get('max_image_width')))
-        ttk.Spinbox(max_width_frame, from_=0, to=4000, increment=100, textvariable=self.max_width_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(max_width_frame, text="pixels").pack(side=tk.LEFT)
-        
-        max_height_frame = ttk.Frame(image_frame)
-        max_height_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(max_height_frame, text="Max height:").pack(side=tk.LEFT)
-        self.max_height_var = tk.StringVar(value=str(self.config.get('max_image_height')))
-        ttk.Spinbox(max_height_frame, from_=0, to=4000, increment=100, textvariable=self.max_height_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(max_height_frame, text="pixels").pack(side=tk.LEFT)
-        
-        # === Files Tab ===
-        files_frame = ttk.Frame(notebook, padding=15)
-        notebook.add(files_frame, text="Files")
+        thin_rule(image_frame).pack(fill=tk.X, pady=5)
+        
+        rows = ttk.Frame(image_frame)
+        rows.pack(fill=tk.X)
+        
+        self.max_width_var = tk.IntVar(value=self.config.get('max_image_width'))
+        grid_row(rows, "Max width:", ttk.Spinbox(rows, from_=0, to=4000, increment=100, textvariable=self.max_width_var, width=8), "pixels")
         
+        self.max_height_var = tk.IntVar(value=self.config.get('max_image_height'))
+        grid_row(rows, "Max height:", ttk.Spinbox(rows, from_=0, to=4000, increment=100, textvariable=self.max_height_var, width=8), "pixels")
+        
+        # Used whenever a capture is shrunk: to fit these limits or by the resolution scale
+        self.resample_var = tk.StringVar(value=self.config.get('resample_filter'))
+        grid_row(rows, "Resize filter:", ttk.Combobox(rows, textvariable=self.resample_var, values=list(RESAMPLE_FILTERS), width=10, state='readonly'), "(lanczos = sharpest, slowest)")
+        
+        ttk.Label(image_frame, text="Encoding", style='Header.TLabel').pack(anchor=tk.W, pady=(15, 0))
+        thin_rule(image_frame).pack(fill=tk.X, pady=5)
+        
+        rows = ttk.Frame(image_frame)
+        rows.pack(fill=tk.X)
+        
+        self.png_level_var = tk.IntVar(value=self.config.get('png_compression_level'))
+        grid_row(rows, "PNG compression:", ttk.Spinbox(rows, from_=0, to=9, increment=1, textvariable=self.png_level_var, width=8), "(higher = smaller but slower)")
+    
+    def _build_files_tab(self, files_frame):
+        """Build the Files tab."""
         ttk.Label(files_frame, text="File Organization", style='Header.TLabel').pack(anchor=tk.W)
-        ttk.Separator(files_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(files_frame).pack(fill=tk.X, pady=5)
         
         self.date_org_var = tk.BooleanVar(value=self.config.get('organize_by_date'))
         ttk.Checkbutton(files_frame, text="Organize by date", variable=self.date_org_var).pack(anchor=tk.W)
@@ -3215,26 +4135,23 @@ class AdvancedSettingsWindow:
         ttk.Radiobutton(date_format_frame, text="Weekly", variable=self.date_format_var, value='weekly').pack(side=tk.LEFT, padx=5)
         ttk.Radiobutton(date_format_frame, text="Monthly", variable=self.date_format_var, value='monthly').pack(side=tk.LEFT, padx=5)
         
-        max_files_frame = ttk.Frame(files_frame)
-        max_files_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(max_files_frame, text="Max files per folder:").pack(side=tk.LEFT)
-        self.max_files_var = tk.StringVar(value=str(self.config.get('max_files_per_folder')))
-        ttk.Spinbox(max_files_frame, from_=0, to=1000, increment=50, textvariable=self.max_files_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(max_files_frame, text="(0 = unlimited)").pack(side=tk.LEFT)
+        rows = ttk.Frame(files_frame)
+        rows.pack(fill=tk.X)
+        
+        self.max_files_var = tk.IntVar(value=self.config.get('max_files_per_folder'))
+        grid_row(rows, "Max files per folder:", ttk.Spinbox(rows, from_=0, to=1000, increment=50, textvariable=self.max_files_var, width=8), "(0 = unlimited)")
         
         ttk.Label(files_frame, text="Filename Template", style='Header.TLabel').pack(anchor=tk.W, pady=(15, 0))
-        ttk.Separator(files_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(files_frame).pack(fill=tk.X, pady=5)
         
         self.template_var = tk.StringVar(value=self.config.get('filename_template'))
         ttk.Entry(files_frame, textvariable=self.template_var, width=40).pack(anchor=tk.W, pady=5)
         ttk.Label(files_frame, text="Variables: {document}, {date}, {time}, {datetime}, {year}, {month}, {day}", font=('Segoe UI', 8)).pack(anchor=tk.W)
-        
-        # === Filters Tab ===
-        filters_frame = ttk.Frame(notebook, padding=15)
-        notebook.add(filters_frame, text="Filters")
-        
+    
+    def _build_filters_tab(self, filters_frame):
+        """Build the Filters tab."""
         ttk.Label(filters_frame, text="Document Filters", style='Header.TLabel').pack(anchor=tk.W)
-        ttk.Separator(filters_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(filters_frame).pack(fill=tk.X, pady=5)
         
         ttk.Label(filters_frame, text="Whitelist (only capture these, comma-separated):").pack(anchor=tk.W)
         self.whitelist_var = tk.StringVar(value=self.config.get('filename_whitelist'))
@@ -3245,42 +4162,30 @@ class AdvancedSettingsWindow:
         ttk.Entry(filters_frame, textvariable=self.blacklist_var, width=50).pack(anchor=tk.W, pady=5)
         
         ttk.Label(filters_frame, text="Window Size Filters", style='Header.TLabel').pack(anchor=tk.W, pady=(15, 0))
-        ttk.Separator(filters_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
-        
-        min_w_frame = ttk.Frame(filters_frame)
-        min_w_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(min_w_frame, text="Min window width:").pack(side=tk.LEFT)
-        self.min_win_w_var = tk.StringVar(value=str(self.config.get('min_window_width')))
-        ttk.Spinbox(min_w_frame, from_=0, to=1000, increment=50, textvariable=self.min_win_w_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(min_w_frame, text="pixels").pack(side=tk.LEFT)
-        
-        min_h_frame = ttk.Frame(filters_frame)
-        min_h_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(min_h_frame, text="Min window height:").pack(side=tk.LEFT)
-        self.min_win_h_var = tk.StringVar(value=str(self.config.get('min_window_height')))
-        ttk.Spinbox(min_h_frame, from_=0, to=1000, increment=50, textvariable=self.min_win_h_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(min_h_frame, text="pixels").pack(side=tk.LEFT)
-        
-        # === Notifications Tab ===
-        notif_frame = ttk.Frame(notebook, padding=15)
-        notebook.add(notif_frame, text="Notifications")
+        thin_rule(filters_frame).pack(fill=tk.X, pady=5)
+        
+        rows = ttk.Frame(filters_frame)
+        rows.pack(fill=tk.X)
         
+        self.min_win_w_var = tk.IntVar(value=self.config.get('min_window_width'))
+        grid_row(rows, "Min window width:", ttk.Spinbox(rows, from_=0, to=1000, increment=50, textvariable=self.min_win_w_var, width=8), "pixels")
+        
+        self.min_win_h_var = tk.IntVar(value=self.config.get('min_window_height'))
+        grid_row(rows, "Min window height:", ttk.Spinbox(rows, from_=0, to=1000, increment=50, textvariable=self.min_win_h_var, width=8), "pixels")
+    
+    def _build_notifications_tab(self, notif_frame):
+        """Build the Notifications tab."""
         ttk.Label(notif_frame, text="Notification Settings", style='Header.TLabel').pack(anchor=tk.W)
-        ttk.Separator(notif_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
-        
-        dur_frame = ttk.Frame(notif_frame)
-        dur_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(dur_frame, text="Notification duration:").pack(side=tk.LEFT)
-        self.notif_dur_var = tk.StringVar(value=str(self.config.get('notification_duration')))
-        ttk.Spinbox(dur_frame, from_=1, to=10, increment=1, textvariable=self.notif_dur_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(dur_frame, text="seconds").pack(side=tk.LEFT)
-        
-        vol_frame = ttk.Frame(notif_frame)
-        vol_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(vol_frame, text="Sound volume:").pack(side=tk.LEFT)
-        self.volume_var = tk.StringVar(value=str(self.config.get('sound_volume')))
-        ttk.Spinbox(vol_frame, from_=0, to=100, increment=10, textvariable=self.volume_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(vol_frame, text="%").pack(side=tk.LEFT)
+        thin_rule(notif_frame).pack(fill=tk.X, pady=5)
+        
+        rows = ttk.Frame(notif_frame)
+        rows.pack(fill=tk.X)
+        
+        self.notif_dur_var = tk.IntVar(value=self.config.get('notification_duration'))
+        grid_row(rows, "Notification duration:", ttk.Spinbox(rows, from_=1, to=10, increment=1, textvariable=self.notif_dur_var, width=8), "seconds")
+        
+        self.volume_var = tk.IntVar(value=self.config.get('sound_volume'))
+        grid_row(rows, "Sound volume:", ttk.Spinbox(rows, from_=0, to=100, increment=10, textvariable=self.volume_var, width=8), "%")
         
         ttk.Label(notif_frame, text="Custom sound file (.wav):").pack(anchor=tk.W, pady=(10, 0))
         sound_frame = ttk.Frame(notif_frame)
@@ -3288,13 +4193,11 @@ class AdvancedSettingsWindow:
         self.sound_file_var = tk.StringVar(value=self.config.get('custom_sound_file'))
         ttk.Entry(sound_frame, textvariable=self.sound_file_var, width=40).pack(side=tk.LEFT)
         ttk.Button(sound_frame, text="Browse", command=self.browse_sound).pack(side=tk.LEFT, padx=5)
-        
-        # === Watermark Tab ===
-        watermark_frame = ttk.Frame(notebook, padding=15)
-        notebook.add(watermark_frame, text="Watermark")
-        
+    
+    def _build_watermark_tab(self, watermark_frame):
+        """Build the Watermark tab."""
         ttk.Label(watermark_frame, text="Watermark Settings", style='Header.TLabel').pack(anchor=tk.W)
-        ttk.Separator(watermark_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(watermark_frame).pack(fill=tk.X, pady=5)
         
         self.watermark_enabled_var = tk.BooleanVar(value=self.config.get('watermark_enabled'))
         ttk.Checkbutton(watermark_frame, text="Enable watermark on captures", variable=self.watermark_enabled_var).pack(anchor=tk.W)
@@ -3324,32 +4227,22 @@ class AdvancedSettingsWindow:
         for text, value in positions:
             ttk.Radiobutton(pos_frame, text=text, variable=self.watermark_pos_var, value=value).pack(side=tk.LEFT, padx=3)
         
-        opacity_frame = ttk.Frame(watermark_frame)
-        opacity_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(opacity_frame, text="Opacity:").pack(side=tk.LEFT)
-        self.watermark_opacity_var = tk.StringVar(value=str(self.config.get('watermark_opacity')))
-        ttk.Spinbox(opacity_frame, from_=10, to=100, increment=10, textvariable=self.watermark_opacity_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(opacity_frame, text="%").pack(side=tk.LEFT)
-        
-        font_frame = ttk.Frame(watermark_frame)
-        font_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(font_frame, text="Font size:").pack(side=tk.LEFT)
-        self.watermark_fontsize_var = tk.StringVar(value=str(self.config.get('watermark_font_size')))
-        ttk.Spinbox(font_frame, from_=8, to=48, increment=2, textvariable=self.watermark_fontsize_var, width=8).pack(side=tk.LEFT, padx=5)
-        
-        color_frame = ttk.Frame(watermark_frame)
-        color_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(color_frame, text="Text color:").pack(side=tk.LEFT)
-        self.watermark_color_var = tk.StringVar(value=self.config.get('watermark_color'))
-        ttk.Entry(color_frame, textvariable=self.watermark_color_var, width=10).pack(side=tk.LEFT, padx=5)
-        ttk.Label(color_frame, text="(hex, e.g. #ffffff)").pack(side=tk.LEFT)
+        rows = ttk.Frame(watermark_frame)
+        rows.pack(fill=tk.X)
+        
+        self.watermark_opacity_var = tk.IntVar(value=self.config.get('watermark_opacity'))
+        grid_row(rows, "Opacity:", ttk.Spinbox(rows, from_=10, to=100, increment=10, textvariable=self.watermark_opacity_var, width=8), "%")
         
-        # === Cropping Tab ===
-        crop_frame = ttk.Frame(notebook, padding=15)
-        notebook.add(crop_frame, text="Cropping")
+        self.watermark_fontsize_var = tk.IntVar(value=self.config.get('watermark_font_size'))
+        grid_row(rows, "Font size:", ttk.Spinbox(rows, from_=8, to=48, increment=2, textvariable=self.watermark_fontsize_var, width=8))
         
+        self.watermark_color_var = tk.StringVar(value=self.config.get('watermark_color'))
+        grid_row(rows, "Text color:", ttk.Entry(rows, textvariable=self.watermark_color_var, width=10), "(hex, e.g. #ffffff)")
+    
+    def _build_cropping_tab(self, crop_frame):
+        """Build the Cropping tab."""
         ttk.Label(crop_frame, text="Crop Settings", style='Header.TLabel').pack(anchor=tk.W)
-        ttk.Separator(crop_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(crop_frame).pack(fill=tk.X, pady=5)
         
         self.crop_enabled_var = tk.BooleanVar(value=self.config.get('crop_enabled'))
         ttk.Checkbutton(crop_frame, text="Enable custom crop margins", variable=self.crop_enabled_var).pack(anchor=tk.W)
@@ -3360,49 +4253,34 @@ class AdvancedSettingsWindow:
         margins_frame.pack(fill=tk.X, pady=10)
         
         # Top
-        top_frame = ttk.Frame(margins_frame)
-        top_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(top_frame, text="Top:", width=10).pack(side=tk.LEFT)
-        self.crop_top_var = tk.StringVar(value=str(self.config.get('crop_top')))
-        ttk.Spinbox(top_frame, from_=0, to=500, increment=10, textvariable=self.crop_top_var, width=8).pack(side=tk.LEFT, padx=5)
+        self.crop_top_var = tk.IntVar(value=self.config.get('crop_top'))
+        grid_row(margins_frame, "Top:", ttk.Spinbox(margins_frame, from_=0, to=500, increment=10, textvariable=self.crop_top_var, width=8), pady=2)
         
         # Bottom
-        bottom_frame = ttk.Frame(margins_frame)
-        bottom_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(bottom_frame, text="Bottom:", width=10).pack(side=tk.LEFT)
-        self.crop_bottom_var = tk.StringVar(value=str(self.config.get('crop_bottom')))
-        ttk.Spinbox(bottom_frame, from_=0, to=500, increment=10, textvariable=self.crop_bottom_var, width=8).pack(side=tk.LEFT, padx=5)
+        self.crop_bottom_var = tk.IntVar(value=self.config.get('crop_bottom'))
+        grid_row(margins_frame, "Bottom:", ttk.Spinbox(margins_frame, from_=0, to=500, increment=10, textvariable=self.crop_bottom_var, width=8), pady=2)
         
         # Left
-        left_frame = ttk.Frame(margins_frame)
-        left_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(left_frame, text="Left:", width=10).pack(side=tk.LEFT)
-        self.crop_left_var = tk.StringVar(value=str(self.config.get('crop_left')))
-        ttk.Spinbox(left_frame, from_=0, to=500, increment=10, textvariable=self.crop_left_var, width=8).pack(side=tk.LEFT, padx=5)
+        self.crop_left_var = tk.IntVar(value=self.config.get('crop_left'))
+        grid_row(margins_frame, "Left:", ttk.Spinbox(margins_frame, from_=0, to=500, increment=10, textvariable=self.crop_left_var, width=8), pady=2)
         
         # Right
-        right_frame = ttk.Frame(margins_frame)
-        right_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(right_frame, text="Right:", width=10).pack(side=tk.LEFT)
-        self.crop_right_var = tk.StringVar(value=str(self.config.get('crop_right')))
-        ttk.Spinbox(right_frame, from_=0, to=500, increment=10, textvariable=self.crop_right_var, width=8).pack(side=tk.LEFT, padx=5)
+        self.crop_right_var = tk.IntVar(value=self.config.get('crop_right'))
+        grid_row(margins_frame, "Right:", ttk.Spinbox(margins_frame, from_=0, to=500, increment=10, textvariable=self.crop_right_var, width=8), pady=2)
         
         ttk.Label(crop_frame, text="Resolution Scaling", style='Header.TLabel').pack(anchor=tk.W, pady=(15, 5))
-        ttk.Separator(crop_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(crop_frame).pack(fill=tk.X, pady=5)
         
-        scale_frame = ttk.Frame(crop_frame)
-        scale_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(scale_frame, text="Resolution scale:").pack(side=tk.LEFT)
-        self.resolution_scale_var = tk.StringVar(value=str(self.config.get('resolution_scale')))
-        ttk.Spinbox(scale_frame, from_=25, to=100, increment=5, textvariable=self.resolution_scale_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(scale_frame, text="% (lower = smaller files)").pack(side=tk.LEFT)
-        
-        # === Actions Tab ===
-        actions_frame = ttk.Frame(notebook, padding=15)
-        notebook.add(actions_frame, text="Actions")
+        rows = ttk.Frame(crop_frame)
+        rows.pack(fill=tk.X)
         
+        self.resolution_scale_var = tk.IntVar(value=self.config.get('resolution_scale'))
+        grid_row(rows, "Resolution scale:", ttk.Spinbox(rows, from_=25, to=100, increment=5, textvariable=self.resolution_scale_var, width=8), "% (lower = smaller files)")
+    
+    def _build_actions_tab(self, actions_frame):
+        """Build the Actions tab."""
         ttk.Label(actions_frame, text="Post-Capture Actions", style='Header.TLabel').pack(anchor=tk.W)
-        ttk.Separator(actions_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(actions_frame).pack(fill=tk.X, pady=5)
         
         self.clipboard_var = tk.BooleanVar(value=self.config.get('auto_copy_clipboard'))
         ttk.Checkbutton(actions_frame, text="Copy to clipboard after capture", variable=self.clipboard_var).pack(anchor=tk.W)
@@ -3410,15 +4288,14 @@ class AdvancedSettingsWindow:
         self.auto_compress_var = tk.BooleanVar(value=self.config.get('auto_compress'))
         ttk.Checkbutton(actions_frame, text="Auto-compress images", variable=self.auto_compress_var).pack(anchor=tk.W)
         
-        compress_frame = ttk.Frame(actions_frame)
-        compress_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(compress_frame, text="Compression quality:").pack(side=tk.LEFT)
-        self.compression_var = tk.StringVar(value=str(self.config.get('compression_level')))
-        ttk.Spinbox(compress_frame, from_=50, to=95, increment=5, textvariable=self.compression_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(compress_frame, text="% (lower = smaller)").pack(side=tk.LEFT)
+        rows = ttk.Frame(actions_frame)
+        rows.pack(fill=tk.X)
+        
+        self.compression_var = tk.IntVar(value=self.config.get('compression_level'))
+        grid_row(rows, "Compression quality:", ttk.Spinbox(rows, from_=50, to=95, increment=5, textvariable=self.compression_var, width=8), "% (lower = smaller)")
         
         ttk.Label(actions_frame, text="Backup Folder", style='Header.TLabel').pack(anchor=tk.W, pady=(15, 0))
-        ttk.Separator(actions_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(actions_frame).pack(fill=tk.X, pady=5)
         
         self.backup_enabled_var = tk.BooleanVar(value=self.config.get('backup_folder_enabled'))
         ttk.Checkbutton(actions_frame, text="Save copy to backup folder", variable=self.backup_enabled_var).pack(anchor=tk.W)
@@ -3430,7 +4307,7 @@ class AdvancedSettingsWindow:
         ttk.Button(backup_path_frame, text="Browse", command=self.browse_backup_folder).pack(side=tk.LEFT, padx=5)
         
         ttk.Label(actions_frame, text="Post-Capture Script", style='Header.TLabel').pack(anchor=tk.W, pady=(15, 0))
-        ttk.Separator(actions_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(actions_frame).pack(fill=tk.X, pady=5)
         
         self.script_enabled_var = tk.BooleanVar(value=self.config.get('post_capture_script_enabled'))
         ttk.Checkbutton(actions_frame, text="Run script after each capture", variable=self.script_enabled_var).pack(anchor=tk.W)
@@ -3441,20 +4318,17 @@ class AdvancedSettingsWindow:
         ttk.Entry(script_path_frame, textvariable=self.script_path_var, width=35).pack(side=tk.LEFT)
         ttk.Button(script_path_frame, text="Browse", command=self.browse_script).pack(side=tk.LEFT, padx=5)
         ttk.Label(actions_frame, text="(Script will receive filepath as first argument)", font=('Segoe UI', 8)).pack(anchor=tk.W)
-        
-        # === Performance Tab ===
-        perf_frame = ttk.Frame(notebook, padding=15)
-        notebook.add(perf_frame, text="Performance")
-        
+    
+    def _build_performance_tab(self, perf_frame):
+        """Build the Performance tab."""
         ttk.Label(perf_frame, text="Performance Settings", style='Header.TLabel').pack(anchor=tk.W)
-        ttk.Separator(perf_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(perf_frame).pack(fill=tk.X, pady=5)
+        
+        rows = ttk.Frame(perf_frame)
+        rows.pack(fill=tk.X)
         
-        mem_frame = ttk.Frame(perf_frame)
-        mem_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(mem_frame, text="Memory limit:").pack(side=tk.LEFT)
-        self.memory_limit_var = tk.StringVar(value=str(self.config.get('memory_limit_mb')))
-        ttk.Spinbox(mem_frame, from_=0, to=2000, increment=100, textvariable=self.memory_limit_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(mem_frame, text="MB (0 = no limit)").pack(side=tk.LEFT)
+        self.memory_limit_var = tk.IntVar(value=self.config.get('memory_limit_mb'))
+        grid_row(rows, "Memory limit:", ttk.Spinbox(rows, from_=0, to=2000, increment=100, textvariable=self.memory_limit_var, width=8), "MB (0 = no limit)")
         
         ttk.Label(perf_frame, text="CPU Priority:").pack(anchor=tk.W, pady=(10, 0))
         priority_frame = ttk.Frame(perf_frame)
@@ -3467,18 +4341,16 @@ class AdvancedSettingsWindow:
         self.background_var = tk.BooleanVar(value=self.config.get('background_processing'))
         ttk.Checkbutton(perf_frame, text="Process captures in background", variable=self.background_var).pack(anchor=tk.W, pady=5)
         
-        concurrent_frame = ttk.Frame(perf_frame)
-        concurrent_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(concurrent_frame, text="Max concurrent saves:").pack(side=tk.LEFT)
-        self.concurrent_var = tk.StringVar(value=str(self.config.get('max_concurrent_saves')))
-        ttk.Spinbox(concurrent_frame, from_=1, to=10, increment=1, textvariable=self.concurrent_var, width=8).pack(side=tk.LEFT, padx=5)
-        
-        # === Updates Tab ===
-        updates_frame = ttk.Frame(notebook, padding=15)
-        notebook.add(updates_frame, text="Updates")
+        rows = ttk.Frame(perf_frame)
+        rows.pack(fill=tk.X)
         
+        self.concurrent_var = tk.IntVar(value=self.config.get('max_concurrent_saves'))
+        grid_row(rows, "Max concurrent saves:", ttk.Spinbox(rows, from_=1, to=10, increment=1, textvariable=self.concurrent_var, width=8))
+    
+    def _build_updates_tab(self, updates_frame):
+        """Build the Updates tab."""
         ttk.Label(updates_frame, text="Auto-Update Settings", style='Header.TLabel').pack(anchor=tk.W)
-        ttk.Separator(updates_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(updates_frame).pack(fill=tk.X, pady=5)
         
         self.auto_update_var = tk.BooleanVar(value=self.config.get('auto_update_check'))
         ttk.Checkbutton(
@@ -3487,17 +4359,16 @@ class AdvancedSettingsWindow:
             variable=self.auto_update_var
         ).pack(anchor=tk.W, pady=2)
         
-        interval_frame = ttk.Frame(updates_frame)
-        interval_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(interval_frame, text="Check every:").pack(side=tk.LEFT)
-        self.update_interval_var = tk.StringVar(value=str(self.config.get('update_check_interval')))
-        ttk.Spinbox(interval_frame, from_=1, to=168, increment=1, textvariable=self.update_interval_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(interval_frame, text="hours").pack(side=tk.LEFT)
+        rows = ttk.Frame(updates_frame)
+        rows.pack(fill=tk.X)
         
-        ttk.Separator(updates_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=15)
+        self.update_interval_var = tk.IntVar(value=self.config.get('update_check_interval'))
+        grid_row(rows, "Check every:", ttk.Spinbox(rows, from_=1, to=168, increment=1, textvariable=self.update_interval_var, width=8), "hours")
+        
+        thin_rule(updates_frame).pack(fill=tk.X, pady=15)
         
         ttk.Label(updates_frame, text="Current Version", style='Header.TLabel').pack(anchor=tk.W)
-        ttk.Separator(updates_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        thin_rule(updates_frame).pack(fill=tk.X, pady=5)
         
         ttk.Label(updates_frame, text=f"Version: {APP_VERSION}", font=('Segoe UI', 10)).pack(anchor=tk.W, pady=5)
         
@@ -3507,38 +4378,19 @@ class AdvancedSettingsWindow:
             skip_frame.pack(fill=tk.X, pady=5)
             ttk.Label(skip_frame, text=f"Skipped version: {skipped}").pack(side=tk.LEFT)
             ttk.Button(skip_frame, text="Clear", command=self.clear_skipped_version).pack(side=tk.LEFT, padx=10)
-        
-        # Save/Close buttons
-        btn_frame = ttk.Frame(self.window)
-        btn_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        ttk.Button(btn_frame, text="Save All", command=self.save_all).pack(side=tk.LEFT)
-        ttk.Button(btn_frame, text="Close", command=self.close).pack(side=tk.RIGHT)
-        
-        # Center window
-        self.window.update_idletasks()
-        x = (self.window.winfo_screenwidth() // 2) - (325)
-        y = (self.window.winfo_screenheight() // 2) - (350)
-        self.window.geometry(f'+{x}+{y}')
-        
-        self.window.protocol("WM_DELETE_WINDOW", self.close)
-        self.window.mainloop()
     
     def browse_sound(self):
-        from tkinter import filedialog
-        file = filedialog.askopenfilename(filetypes=[("WAV files", "*.wav")])
+        file = filedialog.askopenfilename(filetypes=[("WAV files", "*.wav")], parent=self.window)
         if file:
             self.sound_file_var.set(file)
     
     def browse_backup_folder(self):
-        from tkinter import filedialog
-        folder = filedialog.askdirectory()
+        folder = filedialog.askdirectory(parent=self.window, mustexist=True)
         if folder:
             self.backup_folder_var.set(folder)
     
     def browse_script(self):
-        from tkinter import filedialog
-        file = filedialog.askopenfilename(filetypes=[("All files", "*.*"), ("Batch files", "*.bat"), ("PowerShell", "*.ps1"), ("Python", "*.py")])
+        file = filedialog.askopenfilename(filetypes=[("All files", "*.*"), ("Batch files", "*.bat"), ("PowerShell", "*.ps1"), ("Python", "*.py")], parent=self.window)
         if file:
             self.script_path_var.set(file)
     
@@ -3546,83 +4398,119 @@ class AdvancedSettingsWindow:
         """Clear all captured page hashes to allow re-capturing."""
         if self.monitor:
             self.monitor.clear_captured_hashes()
-            from tkinter import messagebox
-            messagebox.showinfo("Success", "Captured page history cleared.\nPages can now be re-captured.")
+            messagebox.showinfo("Success", "Captured page history cleared.\nPages can now be re-captured.", parent=self.window)
     
     def save_all(self):
-        # Capture settings
-        self.config.set('capture_on_click', self.click_var.get())
-        self.config.set('capture_cooldown', float(self.cooldown_var.get()))
-        self.config.set('min_scroll_distance', int(self.min_scroll_var.get()))
-        self.config.set('max_captures_per_document', int(self.max_captures_var.get()))
+        # Only tabs that were opened have widgets to read; the rest keep their values
+        built = self._built_tabs
+        values = {}
         
-        # Duplicate detection settings
-        self.config.set('duplicate_detection_enabled', self.dup_detect_var.get())
-        self.config.set('duplicate_similarity_threshold', int(self.dup_thresh_var.get()))
-        self.config.set('duplicate_hash_size', int(self.dup_hash_var.get()))
+        # Capture settings
+        if 'Capture' in built:
+            values.update({
+                'capture_on_click': self.click_var.get(),
+                'capture_cooldown': read_number(self.cooldown_var, self.config, 'capture_cooldown'),
+                'min_scroll_distance': read_number(self.min_scroll_var, self.config, 'min_scroll_distance'),
+                'max_captures_per_document': read_number(self.max_captures_var, self.config, 'max_captures_per_document'),
+                
+                # Duplicate detection settings
+                'duplicate_detection_enabled': self.dup_detect_var.get(),
+                'duplicate_similarity_threshold': read_number(self.dup_thresh_var, self.config, 'duplicate_similarity_threshold'),
+                'duplicate_hash_size': read_number(self.dup_hash_var, self.config, 'duplicate_hash_size'),
+            })
         
         # Image settings
-        self.config.set('grayscale_mode', self.grayscale_var.get())
-        self.config.set('add_border', self.border_var.get())
-        self.config.set('border_size', int(self.border_size_var.get()))
-        self.config.set('border_color', self.border_color_var.get())
-        self.config.set('max_image_width', int(self.max_width_var.get()))
-        self.config.set('max_image_height', int(self.max_height_var.get()))
+        if 'Image' in built:
+            values.update({
+                'grayscale_mode': self.grayscale_var.get(),
+                'add_border': self.border_var.get(),
+                'border_size': read_number(self.border_size_var, self.config, 'border_size'),
+                'border_color': self.border_color_var.get(),
+                'max_image_width': read_number(self.max_width_var, self.config, 'max_image_width'),
+                'max_image_height': read_number(self.max_height_var, self.config, 'max_image_height'),
+                'resample_filter': self.resample_var.get(),
+                'png_compression_level': max(0, min(9, read_number(self.png_level_var, self.config, 'png_compression_level'))),
+            })
         
         # File settings
-        self.config.set('organize_by_date', self.date_org_var.get())
-        self.config.set('date_folder_format', self.date_format_var.get())
-        self.config.set('max_files_per_folder', int(self.max_files_var.get()))
-        self.config.set('filename_template', self.template_var.get())
+        if 'Files' in built:
+            values.update({
+                'organize_by_date': self.date_org_var.get(),
+                'date_folder_format': self.date_format_var.get(),
+                'max_files_per_folder': read_number(self.max_files_var, self.config, 'max_files_per_folder'),
+                'filename_template': self.template_var.get(),
+            })
         
         # Filter settings
-        self.config.set('filename_whitelist', self.whitelist_var.get())
-        self.config.set('filename_blacklist', self.blacklist_var.get())
-        self.config.set('min_window_width', int(self.min_win_w_var.get()))
-        self.config.set('min_window_height', int(self.min_win_h_var.get()))
+        if 'Filters' in built:
+            values.update({
+                'filename_whitelist': self.whitelist_var.get(),
+                'filename_blacklist': self.blacklist_var.get(),
+                'min_window_width': read_number(self.min_win_w_var, self.config, 'min_window_width'),
+                'min_window_height': read_number(self.min_win_h_var, self.config, 'min_window_height'),
+            })
         
         # Notification settings
-        self.config.set('notification_duration', int(self.notif_dur_var.get()))
-        self.config.set('sound_volume', int(self.volume_var.get()))
-        self.config.set('custom_sound_file', self.sound_file_var.get())
+        if 'Notifications' in built:
+            values.update({
+                'notification_duration': read_number(self.notif_dur_var, self.config, 'notification_duration'),
+                'sound_volume': read_number(self.volume_var, self.config, 'sound_volume'),
+                'custom_sound_file': self.sound_file_var.get(),
+            })
         
         # Watermark settings
-        self.config.set('watermark_enabled', self.watermark_enabled_var.get())
-        self.config.set('watermark_type', self.watermark_type_var.get())
-        self.config.set('watermark_text', self.watermark_text_var.get())
-        self.config.set('watermark_timestamp_format', self.watermark_ts_format_var.get())
-        self.config.set('watermark_position', self.watermark_pos_var.get())
-        self.config.set('watermark_opacity', int(self.watermark_opacity_var.get()))
-        self.config.set('watermark_font_size', int(self.watermark_fontsize_var.get()))
-        self.config.set('watermark_color', self.watermark_color_var.get())
+        if 'Watermark' in built:
+            values.update({
+                'watermark_enabled': self.watermark_enabled_var.get(),
+                'watermark_type': self.watermark_type_var.get(),
+                'watermark_text': self.watermark_text_var.get(),
+                'watermark_timestamp_format': self.watermark_ts_format_var.get(),
+                'watermark_position': self.watermark_pos_var.get(),
+                'watermark_opacity': read_number(self.watermark_opacity_var, self.config, 'watermark_opacity'),
+                'watermark_font_size': read_number(self.watermark_fontsize_var, self.config, 'watermark_font_size'),
+                'watermark_color': self.watermark_color_var.get(),
+            })
         
         # Cropping settings
-        self.config.set('crop_enabled', self.crop_enabled_var.get())
-        self.config.set('crop_top', int(self.crop_top_var.get()))
-        self.config.set('crop_bottom', int(self.crop_bottom_var.get()))
-        self.config.set('crop_left', int(self.crop_left_var.get()))
-        self.config.set('crop_right', int(self.crop_right_var.get()))
-        self.config.set('resolution_scale', int(self.resolution_scale_var.get()))
+        if 'Cropping' in built:
+            values.update({
+                'crop_enabled': self.crop_enabled_var.get(),
+                'crop_top': read_number(self.crop_top_var, self.config, 'crop_top'),
+                'crop_bottom': read_number(self.crop_bottom_var, self.config, 'crop_bottom'),
+                'crop_left': read_number(self.crop_left_var, self.config, 'crop_left'),
+                'crop_right': read_number(self.crop_right_var, self.config, 'crop_right'),
+                'resolution_scale': read_number(self.resolution_scale_var, self.config, 'resolution_scale'),
+            })
         
         # Actions settings
-        self.config.set('auto_copy_clipboard', self.clipboard_var.get())
-        self.config.set('auto_compress', self.auto_compress_var.get())
-        self.config.set('compression_level', int(self.compression_var.get()))
-        self.config.set('backup_folder_enabled', self.backup_enabled_var.get())
-        self.config.set('backup_folder', self.backup_folder_var.get())
-        self.config.set('post_capture_script_enabled', self.script_enabled_var.get())
-        self.config.set('post_capture_script', self.script_path_var.get())
+        if 'Actions' in built:
+            values.update({
+                'auto_copy_clipboard': self.clipboard_var.get(),
+                'auto_compress': self.auto_compress_var.get(),
+                'compression_level': read_number(self.compression_var, self.config, 'compression_level'),
+                'backup_folder_enabled': self.backup_enabled_var.get(),
+                'backup_folder': self.backup_folder_var.get(),
+                'post_capture_script_enabled': self.script_enabled_var.get(),
+                'post_capture_script': self.script_path_var.get(),
+            })
         
         # Performance settings
-        self.config.set('memory_limit_mb', int(self.memory_limit_var.get()))
-        self.config.set('cpu_priority', self.cpu_priority_var.get())
-        self.config.set('background_processing', self.background_var.get())
-        self.config.set('max_concurrent_saves', int(self.concurrent_var.get()))
+        if 'Performance' in built:
+            values.update({
+                'memory_limit_mb': read_number(self.memory_limit_var, self.config, 'memory_limit_mb'),
+                'cpu_priority': self.cpu_priority_var.get(),
+                'background_processing': self.background_var.get(),
+                'max_concurrent_saves': read_number(self.concurrent_var, self.config, 'max_concurrent_saves'),
+            })
         
         # Update settings
-        self.config.set('auto_update_check', self.auto_update_var.get())
-        self.config.set('update_check_interval', int(self.update_interval_var.get()))
+        if 'Updates' in built:
+            values.update({
+                'auto_update_check': self.auto_update_var.get(),
+                'update_check_interval': read_number(self.update_interval_var, self.config, 'update_check_interval'),
+            })
         
+        self.config.update(values)
         logger.info("Advanced settings saved")
         self.close()
     
@@ -3648,6 +4536,17 @@ class PDFScreenshotTool:
         'paused': '#f59e0b',      # Orange - Paused
     }
     
+    # Tooltip text for each state
+    STATUS_TEXT = {
+        'active': 'Capturing (Acrobat active)',
+        'enabled': 'Ready (waiting for Acrobat)',
+        'disabled': 'Disabled',
+        'paused': 'Paused (Ctrl+Shift+P to resume)',
+    }
+    
+    CLEANUP_INTERVAL = 3600  # Run auto cleanup once per hour
+    NOTIFY_COALESCE_WINDOW = 2.0  # Merge capture notifications within this many seconds
+    
     def __init__(self):
         self.config = Config()
         self.stats = Statistics()
@@ -3665,16 +4564,28 @@ class PDFScreenshotTool:
         self.settings_window = SettingsWindow(self.config, self.monitor, self.stats)
         self.icon = None
         self.current_status = 'enabled'
-        
-        # Status monitoring thread
-        self.status_thread = None
-        self.running = True
-        
-    def create_icon_image(self, color=None):
-        """Create a simple icon for the system tray."""
-        if color is None:
-            color = self.COLORS.get(self.current_status, self.COLORS['enabled'])
-        
+        self._stop_event = threading.Event()
+        self._cleanup_timer = None
+        self._notify_queue = queue.Queue(maxsize=16)
+        self._notify_thread = None
+        self._last_cleanup_key = None
+        self._cleanup_oldest_mtime = None  # No file from the last scan is older than this
+        
+        # Menu check states, kept current so menu repaints are attribute reads
+        self._enabled = self.config.get('enabled')
+        self._paused = self.monitor.paused
+        self._has_session = self.session_manager.current_session is not None
+        self.config.add_listener(self._on_config_changed)
+        
+        # Only a handful of states exist, so render each icon once up front
+        self._icon_cache = {status: self._render_icon(color) for status, color in self.COLORS.items()}
+        
+    def create_icon_image(self):
+        """Get the tray icon for the current status."""
+        return self._icon_cache.get(self.current_status, self._icon_cache['enabled'])
+    
+    def _render_icon(self, color):
+        """Draw a simple camera icon for the system tray."""
         width = 64
         height = 64
         image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
@@ -3689,83 +4600,117 @@ class PDFScreenshotTool:
         # Flash
         draw.rectangle([12, 16, 24, 22], fill=color)
         
+        # Make sure the pixel data is materialized before pystray encodes it
+        image.load()
         return image
     
-    def update_icon_status(self):
-        """Update the tray icon based on current status."""
-        while self.running:
-            try:
-                is_acrobat, _, _ = self.monitor.is_acrobat_active()
+    def get_status_title(self, status):
+        """Build the tray tooltip for a status."""
+        capture_count = self.stats.stats.get('session_captures', 0)
+        capture_info = f" | {capture_count} captures today" if capture_count > 0 else ""
+        return f"PDF Screenshot Tool - {self.STATUS_TEXT.get(status, 'Ready')}{capture_info}"
+    
+    def _schedule_cleanup(self, delay):
+        """Arm the timer for the next auto-cleanup run."""
+        self._cleanup_timer = threading.Timer(delay, self._run_cleanup_once)
+        self._cleanup_timer.daemon = True
+        self._cleanup_timer.start()
+    
+    def _run_cleanup_once(self):
+        """Run auto cleanup if enabled, then schedule the next run."""
+        try:
+            if self.config.get('auto_cleanup_enabled'):
+                days = self.config.get('auto_cleanup_days')
+                folder = self.config.get('save_folder')
+                now = time.time()
                 
-                if self.monitor.paused:
-                    new_status = 'paused'
-                elif not self.config.get('enabled'):
-                    new_status = 'disabled'
-                elif is_acrobat:
-                    new_status = 'active'
+                # Nothing can have expired until the oldest file left by the last
+                # scan does; files saved since then are newer than the scan itself
+                scan_key = (folder, days)
+                if (scan_key != self._last_cleanup_key or self._cleanup_oldest_mtime is None
+                        or now - days * 86400 >= self._cleanup_oldest_mtime):
+                    _, oldest = _cleanup_scan(folder, days)
+                    self._last_cleanup_key = scan_key
+                    self._cleanup_oldest_mtime = now if oldest is None else min(oldest, now)
                 else:
-                    new_status = 'enabled'
-                
-                if new_status != self.current_status:
-                    self.current_status = new_status
-                    if self.icon:
-                        self.icon.icon = self.create_icon_image()
-                        
-                        # Update tooltip with capture count
-                        status_text = {
-                            'active': 'Capturing (Acrobat active)',
-                            'enabled': 'Ready (waiting for Acrobat)',
-                            'disabled': 'Disabled',
-                            'paused': 'Paused (Ctrl+Shift+P to resume)'
-                        }
-                        capture_count = self.stats.stats.get('session_captures', 0)
-                        capture_info = f" | {capture_count} captures today" if capture_count > 0 else ""
-                        self.icon.title = f"PDF Screenshot Tool - {status_text.get(new_status, 'Ready')}{capture_info}"
-            except Exception:
-                pass
-            
-            time.sleep(1)
-    
-    def auto_cleanup_task(self):
-        """Periodically run auto cleanup if enabled."""
-        while self.running:
-            try:
-                if self.config.get('auto_cleanup_enabled'):
-                    days = self.config.get('auto_cleanup_days')
-                    folder = self.config.get('save_folder')
-                    deleted = cleanup_old_screenshots(folder, days)
-                    if deleted > 0:
-                        logger.info(f"Auto-cleanup: deleted {deleted} old screenshots")
-            except Exception as e:
-                logger.error(f"Auto-cleanup error: {e}")
-            
-            # Run cleanup once per hour
-            time.sleep(3600)
+                    logger.debug("Auto-cleanup: nothing old enough to expire, skipping scan")
+        except Exception as e:
+            logger.error(f"Auto-cleanup error: {e}")
+        
+        if not self._stop_event.is_set():
+            self._schedule_cleanup(self.CLEANUP_INTERVAL)
     
     def on_capture(self, filepath, doc_name):
         """Called when a screenshot is captured."""
         logger.info(f"Screenshot saved: {filepath}")
         
-        # Show notification if enabled
+        # Show notification if enabled; the worker does the shell call
         if self.config.get('show_notifications') and self.icon:
             try:
-                self.icon.notify(
-                    f"Captured: {doc_name}",
-                    "PDF Screenshot Tool"
-                )
-            except Exception as e:
-                logger.debug(f"Could not show notification: {e}")
+                self._notify_queue.put_nowait(doc_name)
+            except queue.Full:
+                pass
+    
+    def _notification_worker(self):
+        """Show capture notifications, merging bursts into one per document."""
+        while True:
+            doc_name = self._notify_queue.get()
+            if doc_name is None:
+                return
+            
+            # Gather everything else that arrives within the coalesce window
+            counts = {doc_name: 1}
+            stopping = False
+            deadline = time.monotonic() + self.NOTIFY_COALESCE_WINDOW
+            while not stopping:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    doc_name = self._notify_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if doc_name is None:
+                    stopping = True
+                else:
+                    counts[doc_name] = counts.get(doc_name, 0) + 1
+            
+            for doc_name, count in counts.items():
+                message = f"Captured: {doc_name}" if count == 1 else f"Captured {count} pages: {doc_name}"
+                try:
+                    self.icon.notify(message, "PDF Screenshot Tool")
+                except Exception as e:
+                    logger.debug(f"Could not show notification: {e}")
+            
+            if stopping:
+                return
     
     def on_status_change(self, status):
         """Called when monitoring status changes."""
         self.current_status = status
+        self._paused = self.monitor.paused
         if self.icon:
-            self.icon.icon = self.create_icon_image()
+            # pystray rebuilds the native icon on every assignment, so skip
+            # it when the status maps to the image already shown
+            icon_image = self.create_icon_image()
+            if self.icon.icon is not icon_image:
+                self.icon.icon = icon_image
+            self.icon.title = self.get_status_title(status)
+            self.icon.update_menu()
+    
+    def _on_config_changed(self, keys):
+        """Called after settings are changed from any window."""
+        if 'save_folder' in keys:
+            forget_ensured_folders()
+        if 'enabled' in keys:
+            self._enabled = self.config.get('enabled')
+            self.monitor.refresh_status()
+            if self.icon:
+                self.icon.update_menu()
     
     def open_settings(self, icon=None, item=None):
-        """Open settings window in a new thread."""
-        thread = threading.Thread(target=self.settings_window.show, daemon=True)
-        thread.start()
+        """Open settings window on the UI thread."""
+        run_on_ui(self.settings_window.show)
     
     def toggle_enabled(self, icon, item):
         """Toggle screenshot capture on/off."""
@@ -3775,7 +4720,7 @@ class PDFScreenshotTool:
         
     def is_enabled(self, item):
         """Check if enabled for menu checkmark."""
-        return self.config.get('enabled')
+        return self._enabled
     
     def toggle_pause(self, icon=None, item=None):
         """Toggle pause/resume."""
@@ -3783,35 +4728,29 @@ class PDFScreenshotTool:
     
     def is_paused(self, item):
         """Check if paused for menu checkmark."""
-        return self.monitor.paused
+        return self._paused
     
     def capture_now(self, icon=None, item=None):
         """Manually capture screenshot now."""
-        threading.Thread(
-            target=lambda: self.monitor.capture_screenshot(manual=True), 
-            daemon=True
-        ).start()
+        self.monitor.request_capture(manual=True)
     
     def open_folder(self, icon=None, item=None):
         """Open the screenshot folder."""
-        import subprocess
-        folder = self.config.get('save_folder')
-        Path(folder).mkdir(parents=True, exist_ok=True)
-        subprocess.Popen(f'explorer "{folder}"')
+        folder = ensure_folder(self.config.get('save_folder'))
+        launch_detached(['explorer', Path(folder)])
     
     def show_recent(self, icon=None, item=None):
         """Show recent captures window."""
         recent_window = RecentCapturesWindow(self.monitor, self.config)
-        threading.Thread(target=recent_window.show, daemon=True).start()
+        run_on_ui(recent_window.show)
     
     def view_last_capture(self, icon=None, item=None):
         """Open the last captured screenshot."""
-        import subprocess
         if self.monitor.recent_captures:
             last_capture = self.monitor.recent_captures[-1]
             filepath = last_capture['path']
             if Path(filepath).exists():
-                subprocess.Popen(f'explorer /select,"{filepath}"')
+                launch_detached(['explorer', '/select,', filepath])
             else:
                 logger.warning(f"Last capture file not found: {filepath}")
         else:
@@ -3824,17 +4763,19 @@ class PDFScreenshotTool:
     def show_statistics(self, icon=None, item=None):
         """Show statistics window."""
         stats_window = StatisticsWindow(self.stats, self.config)
-        threading.Thread(target=stats_window.show, daemon=True).start()
+        run_on_ui(stats_window.show)
     
     def show_batch_actions(self, icon=None, item=None):
         """Show batch actions window."""
         batch_window = BatchActionsWindow(self.config)
-        threading.Thread(target=batch_window.show, daemon=True).start()
+        run_on_ui(batch_window.show)
     
     def start_session(self, icon=None, item=None):
         """Start a new capture session."""
         name = self.session_manager.start_session()
+        self._has_session = True
         if self.icon:
+            self.icon.update_menu()
             try:
                 self.icon.notify(f"Session started: {name}", "PDF Screenshot Tool")
             except Exception:
@@ -3844,7 +4785,9 @@ class PDFScreenshotTool:
         """End the current capture session."""
         if self.session_manager.current_session:
             info = self.session_manager.end_session()
+            self._has_session = False
             if self.icon:
+                self.icon.update_menu()
                 try:
                     self.icon.notify(f"Session ended: {len(info['captures'])} captures", "PDF Screenshot Tool")
                 except Exception:
@@ -3852,7 +4795,7 @@ class PDFScreenshotTool:
     
     def has_session(self, item):
         """Check if a session is active."""
-        return self.session_manager.current_session is not None
+        return self._has_session
     
     def check_for_updates(self, icon=None, item=None):
         """Manually check for updates."""
@@ -3880,26 +4823,13 @@ class PDFScreenshotTool:
     def show_update_dialog(self, version, notes, url):
         """Show update available dialog."""
         def show_dialog():
-            import tkinter as tk
-            from tkinter import messagebox, scrolledtext
-            
-            root = tk.Tk()
-            root.withdraw()
-            root.attributes('-topmost', True)
-            
             # Create custom dialog
-            dialog = tk.Toplevel(root)
+            dialog = tk.Toplevel(get_ui_root())
             dialog.title("Update Available")
-            dialog.geometry("450x350")
+            center_window(dialog, 450, 350)
             dialog.resizable(False, False)
             dialog.attributes('-topmost', True)
             
-            # Center on screen
-            dialog.update_idletasks()
-            x = (dialog.winfo_screenwidth() - 450) // 2
-            y = (dialog.winfo_screenheight() - 350) // 2
-            dialog.geometry(f"+{x}+{y}")
-            
             # Header
             header = tk.Frame(dialog, bg='#f97316', height=60)
             header.pack(fill=tk.X)
@@ -3956,22 +4886,16 @@ class PDFScreenshotTool:
             btn_frame = tk.Frame(dialog)
             btn_frame.pack(fill=tk.X, padx=20, pady=15)
             
-            result = {'action': None}
-            
             def download_update():
-                result['action'] = 'download'
                 dialog.destroy()
-                root.destroy()
+                self.start_update_download(url)
             
             def skip_version():
-                result['action'] = 'skip'
                 dialog.destroy()
-                root.destroy()
+                self.update_checker.skip_version(version)
             
             def remind_later():
-                result['action'] = 'later'
                 dialog.destroy()
-                root.destroy()
             
             tk.Button(
                 btn_frame,
@@ -4007,36 +4931,20 @@ class PDFScreenshotTool:
             ).pack(side=tk.RIGHT)
             
             dialog.protocol("WM_DELETE_WINDOW", remind_later)
-            dialog.wait_window()
-            
-            # Handle result
-            if result['action'] == 'download':
-                self.start_update_download(url)
-            elif result['action'] == 'skip':
-                self.update_checker.skip_version(version)
         
-        # Run in main thread
-        threading.Thread(target=show_dialog, daemon=True).start()
+        # Called from the update checker thread; the buttons act on the UI thread
+        run_on_ui(show_dialog)
     
     def start_update_download(self, url):
         """Start downloading and installing the update."""
         def show_progress():
-            import tkinter as tk
-            from tkinter import ttk
-            
-            root = tk.Tk()
-            root.title("Downloading Update")
-            root.geometry("350x120")
-            root.resizable(False, False)
-            root.attributes('-topmost', True)
+            window = tk.Toplevel(get_ui_root())
+            window.title("Downloading Update")
+            center_window(window, 350, 120)
+            window.resizable(False, False)
+            window.attributes('-topmost', True)
             
-            # Center on screen
-            root.update_idletasks()
-            x = (root.winfo_screenwidth() - 350) // 2
-            y = (root.winfo_screenheight() - 120) // 2
-            root.geometry(f"+{x}+{y}")
-            
-            frame = tk.Frame(root, padx=20, pady=20)
+            frame = tk.Frame(window, padx=20, pady=20)
             frame.pack(fill=tk.BOTH, expand=True)
             
             status_label = tk.Label(
@@ -4070,33 +4978,45 @@ class PDFScreenshotTool:
                     progress['value'] = 100
                     percent_label.config(text="100%")
                 elif status == 'done':
-                    root.destroy()
-                    # Quit the app to allow installer to run
-                    self.running = False
-                    self.monitor.stop()
-                    if self.icon:
-                        self.icon.stop()
+                    window.destroy()
+                    # Quit the app to allow installer to run; shutdown joins
+                    # worker threads, so keep it off the UI thread
+                    threading.Thread(target=self.shutdown, name="Shutdown").start()
                 elif status == 'error':
                     status_label.config(text=f"Error: {value}")
                     progress['value'] = 0
             
-            # Start download
-            self.update_checker.download_and_install(callback=lambda s, v: root.after(0, on_progress, s, v))
-            
-            root.mainloop()
+            # Start download; progress arrives on the download thread
+            self.update_checker.download_and_install(callback=lambda s, v: run_on_ui(on_progress, s, v))
         
-        threading.Thread(target=show_progress, daemon=True).start()
+        run_on_ui(show_progress)
     
     def quit_app(self, icon, item):
         """Quit the application."""
         logger.info("Application shutting down")
-        self.running = False
+        self.shutdown()
+    
+    def shutdown(self):
+        """Stop background work and remove the tray icon. Safe to call twice."""
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        if self._cleanup_timer:
+            self._cleanup_timer.cancel()
+        if self._notify_thread:
+            self._notify_queue.put(None)
+            self._notify_thread.join(timeout=2.0)
         self.monitor.stop()
-        icon.stop()
+        self.config.flush()
+        self.stats.flush()
+        if self.icon:
+            self.icon.stop()
     
     def run(self):
         """Run the application."""
         logger.info("PDF Screenshot Tool starting...")
+        # Pillow-SIMD reports versions like "9.5.0.post1"
+        logger.info(f"Imaging: Pillow {PIL_VERSION}, resize filter '{self.config.get('resample_filter')}'")
         
         # Show first-run setup if this is the first launch
         if self.config.is_first_run:
@@ -4104,65 +5024,67 @@ class PDFScreenshotTool:
             setup = FirstRunSetup(self.config)
             setup.show()
         
-        # Start the monitor
-        self.monitor.start()
-        
-        # Start status monitoring thread
-        self.status_thread = threading.Thread(target=self.update_icon_status, daemon=True)
-        self.status_thread.start()
-        
-        # Start auto-cleanup thread
-        cleanup_thread = threading.Thread(target=self.auto_cleanup_task, daemon=True)
-        cleanup_thread.start()
-        
-        # Create system tray icon with expanded menu
-        menu = pystray.Menu(
-            pystray.MenuItem(
-                "Enabled",
-                self.toggle_enabled,
-                checked=self.is_enabled
-            ),
-            pystray.MenuItem(
-                "Paused",
-                self.toggle_pause,
-                checked=self.is_paused
-            ),
-            pystray.MenuItem("Capture Now (Ctrl+Shift+S)", self.capture_now),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem(
-                "Session",
-                pystray.Menu(
-                    pystray.MenuItem("Start New Session", self.start_session),
-                    pystray.MenuItem("End Session", self.end_session, enabled=self.has_session),
-                )
-            ),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("View Last Capture", self.view_last_capture, enabled=self.has_last_capture),
-            pystray.MenuItem("Recent Captures", self.show_recent),
-            pystray.MenuItem("Statistics", self.show_statistics),
-            pystray.MenuItem("Batch Actions", self.show_batch_actions),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Open Screenshot Folder (Ctrl+Shift+O)", self.open_folder),
-            pystray.MenuItem("Settings... (Ctrl+Shift+,)", self.open_settings),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem(f"Check for Updates (v{APP_VERSION})", self.check_for_updates),
-            pystray.MenuItem("Quit", self.quit_app)
-        )
-        
-        self.icon = pystray.Icon(
-            "PDF Screenshot Tool",
-            self.create_icon_image(),
-            "PDF Screenshot Tool - Ready",
-            menu
-        )
-        
-        logger.info("PDF Screenshot Tool is running")
-        
-        # Check for updates on startup (if enabled)
-        if self.config.get('auto_update_check'):
-            threading.Timer(5.0, self.auto_check_updates).start()
-        
-        self.icon.run()
+        # Worker threads are non-daemon, so stop them however the tray loop ends
+        try:
+            # Start the monitor
+            self.monitor.start()
+            
+            # First auto-cleanup runs right away, then hourly
+            self._schedule_cleanup(0)
+            
+            # Create system tray icon with expanded menu
+            menu = pystray.Menu(
+                pystray.MenuItem(
+                    "Enabled",
+                    self.toggle_enabled,
+                    checked=self.is_enabled
+                ),
+                pystray.MenuItem(
+                    "Paused",
+                    self.toggle_pause,
+                    checked=self.is_paused
+                ),
+                pystray.MenuItem("Capture Now (Ctrl+Shift+S)", self.capture_now),
+                pystray.Menu.SEPARATOR,
+                pystray.MenuItem(
+                    "Session",
+                    pystray.Menu(
+                        pystray.MenuItem("Start New Session", self.start_session),
+                        pystray.MenuItem("End Session", self.end_session, enabled=self.has_session),
+                    )
+                ),
+                pystray.Menu.SEPARATOR,
+                pystray.MenuItem("View Last Capture", self.view_last_capture, enabled=self.has_last_capture),
+                pystray.MenuItem("Recent Captures", self.show_recent),
+                pystray.MenuItem("Statistics", self.show_statistics),
+                pystray.MenuItem("Batch Actions", self.show_batch_actions),
+                pystray.Menu.SEPARATOR,
+                pystray.MenuItem("Open Screenshot Folder (Ctrl+Shift+O)", self.open_folder),
+                pystray.MenuItem("Settings... (Ctrl+Shift+,)", self.open_settings),
+                pystray.Menu.SEPARATOR,
+                pystray.MenuItem(f"Check for Updates (v{APP_VERSION})", self.check_for_updates),
+                pystray.MenuItem("Quit", self.quit_app)
+            )
+            
+            self.icon = pystray.Icon(
+                "PDF Screenshot Tool",
+                self.create_icon_image(),
+                self.get_status_title(self.current_status),
+                menu
+            )
+            
+            self._notify_thread = threading.Thread(target=self._notification_worker, name="Notifications")
+            self._notify_thread.start()
+            
+            logger.info("PDF Screenshot Tool is running")
+            
+            # Check for updates on startup (if enabled)
+            if self.config.get('auto_update_check'):
+                threading.Timer(5.0, self.auto_check_updates).start()
+            
+            self.icon.run()
+        finally:
+            self.shutdown()
 
 
 def main():